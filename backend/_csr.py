@@ -0,0 +1,241 @@
+"""
+Compressed sparse row (CSR) road graphs and compiled shortest-path kernels for DisasterOps
+"""
+import heapq
+import networkx as nx
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; the kernels run as plain Python without it
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+def build_csr(road_network: nx.Graph, weight: str = 'weight',
+              nodelist: Optional[List[str]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, int]]:
+    """Export a road network as CSR arrays (indptr, indices, weights) plus its node -> index map
+
+    Edges keep the graph's adjacency order, so searches visit neighbours in the same order as NetworkX.
+    Undirected graphs store every edge in both directions.
+    """
+    indptr, indices, (weights,), node_to_idx = build_csr_attributes(road_network, (weight,), nodelist)
+    return indptr, indices, weights, node_to_idx
+
+def build_csr_attributes(road_network: nx.Graph, attributes: Tuple[str, ...],
+                         nodelist: Optional[List[str]] = None) -> Tuple[np.ndarray, np.ndarray, List[np.ndarray], Dict[str, int]]:
+    """Like build_csr, but export several edge attributes (missing ones default to 1) in a single pass"""
+    if nodelist is None:
+        nodelist = list(road_network.nodes)
+    node_to_idx = {node: i for i, node in enumerate(nodelist)}
+
+    indptr = np.zeros(len(nodelist) + 1, dtype=np.int32)
+    indices = []
+    columns = [[] for _ in attributes]
+    for i, node in enumerate(nodelist):
+        for neighbor, data in road_network.adj[node].items():
+            indices.append(node_to_idx[neighbor])
+            for column, attribute in zip(columns, attributes):
+                column.append(data.get(attribute, 1))
+        indptr[i + 1] = len(indices)
+
+    return (indptr, np.array(indices, dtype=np.int32),
+            [np.array(column, dtype=np.float64) for column in columns], node_to_idx)
+
+def edge_slots(indptr: np.ndarray, indices: np.ndarray, node_to_idx: Dict[str, int],
+               edges: List[Tuple[str, str]]) -> np.ndarray:
+    """Positions of the given (u, v) edges in the CSR arrays; edges not in the graph are skipped"""
+    slots = []
+    for u, v in edges:
+        if u in node_to_idx and v in node_to_idx:
+            i, j = node_to_idx[u], node_to_idx[v]
+            matches = np.flatnonzero(indices[indptr[i]:indptr[i + 1]] == j)
+            slots.extend(indptr[i] + matches)
+    return np.array(slots, dtype=np.int64)
+
+@njit(cache=True, nogil=True)
+def dijkstra_csr(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, src: int, dst: int,
+                 blocked_mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Dijkstra over CSR arrays from src, stopping once dst is settled (dst < 0 settles every node)
+
+    Nodes flagged in blocked_mask and edges with non-finite weight are skipped.
+    Returns (dist, pred) arrays; unreachable nodes keep dist inf and pred -1.
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    seen = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    settled = np.zeros(n, dtype=np.bool_)
+
+    # Heap entries carry an insertion counter so ties pop in the same order as NetworkX
+    count = 0
+    seen[src] = 0.0
+    heap = [(0.0, count, np.int64(src))]
+    while len(heap) > 0:
+        d, _, u = heapq.heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = True
+        dist[u] = d
+        if u == dst:
+            break
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = np.int64(indices[k])
+            w = weights[k]
+            if blocked_mask[v] or settled[v] or not np.isfinite(w):
+                continue
+            nd = d + w
+            if nd < seen[v]:
+                seen[v] = nd
+                pred[v] = u
+                count += 1
+                heapq.heappush(heap, (nd, count, v))
+
+    return dist, pred
+
+@njit(cache=True, nogil=True)
+def astar_csr(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, src: int, dst: int,
+              blocked_mask: np.ndarray, lat: np.ndarray, lng: np.ndarray, scale: float) -> np.ndarray:
+    """A* over CSR arrays with a straight-line heuristic scaled from lat/lng degrees
+
+    Mirrors nx.astar_path, including re-expansion when the heuristic is inconsistent.
+    Nodes with NaN coordinates get a zero heuristic. Returns the pred array (pred[dst] < 0 when unreachable).
+    """
+    n = indptr.shape[0] - 1
+    enqueued = np.full(n, np.inf)
+    explored = np.zeros(n, dtype=np.bool_)
+    pred = np.full(n, -1, dtype=np.int64)
+
+    count = 0
+    heap = [(0.0, count, np.int64(src), 0.0, np.int64(-1))]
+    while len(heap) > 0:
+        _, _, u, g, parent = heapq.heappop(heap)
+        if u == dst:
+            pred[u] = parent
+            break
+
+        if explored[u]:
+            # Skip stale entries; a cheaper one for the same node was pushed later
+            if u == src or enqueued[u] < g:
+                continue
+        explored[u] = True
+        pred[u] = parent
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = np.int64(indices[k])
+            w = weights[k]
+            if blocked_mask[v] or not np.isfinite(w):
+                continue
+            ng = g + w
+            if enqueued[v] <= ng:
+                continue
+            enqueued[v] = ng
+
+            h = np.hypot(lat[v] - lat[dst], lng[v] - lng[dst]) * scale
+            if not np.isfinite(h):
+                h = 0.0
+            count += 1
+            heapq.heappush(heap, (ng + h, count, v, ng, u))
+
+    return pred
+
+def transpose_csr(indptr: np.ndarray, indices: np.ndarray,
+                  weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Reverse every edge of a CSR graph, for searches that expand backwards from the target
+
+    Returns (rindptr, rindices, rweights, order), where order[r] is the forward slot of reversed slot r.
+    """
+    n = indptr.shape[0] - 1
+    order = np.argsort(indices, kind='stable')
+    sources = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+    rindptr = np.zeros(n + 1, dtype=np.int32)
+    rindptr[1:] = np.cumsum(np.bincount(indices, minlength=n))
+    return rindptr, sources[order], weights[order], order
+
+@njit(cache=True, nogil=True)
+def _bidirectional_step(heap, indptr, indices, weights, dist, other_dist, settled, link, blocked_mask,
+                        best, meet):
+    """Settle the closest node of one search direction and record any cheaper meeting point"""
+    d, u = heapq.heappop(heap)
+    if settled[u]:
+        return best, meet
+    settled[u] = True
+
+    for k in range(indptr[u], indptr[u + 1]):
+        v = np.int64(indices[k])
+        w = weights[k]
+        if blocked_mask[v] or not np.isfinite(w):
+            continue
+        nd = d + w
+        if nd < dist[v]:
+            dist[v] = nd
+            link[v] = u
+            heapq.heappush(heap, (nd, v))
+        if dist[v] + other_dist[v] < best:
+            best = dist[v] + other_dist[v]
+            meet = v
+    return best, meet
+
+@njit(cache=True, nogil=True)
+def bidirectional_dijkstra_csr(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                               rindptr: np.ndarray, rindices: np.ndarray, rweights: np.ndarray,
+                               src: int, dst: int, blocked_mask: np.ndarray) -> Tuple[float, int, np.ndarray, np.ndarray]:
+    """Bidirectional Dijkstra: grow one search from src and one from dst over the reversed CSR until they meet
+
+    Returns (length, meet, pred, succ); the path runs src -> meet along pred and meet -> dst along succ.
+    meet is -1 when dst is unreachable.
+    """
+    n = indptr.shape[0] - 1
+    forward_dist = np.full(n, np.inf)
+    backward_dist = np.full(n, np.inf)
+    forward_settled = np.zeros(n, dtype=np.bool_)
+    backward_settled = np.zeros(n, dtype=np.bool_)
+    pred = np.full(n, -1, dtype=np.int64)
+    succ = np.full(n, -1, dtype=np.int64)
+
+    forward_dist[src] = 0.0
+    backward_dist[dst] = 0.0
+    if src == dst:
+        return 0.0, np.int64(src), pred, succ
+
+    best = np.inf
+    meet = np.int64(-1)
+    forward_heap = [(0.0, np.int64(src))]
+    backward_heap = [(0.0, np.int64(dst))]
+    while len(forward_heap) > 0 and len(backward_heap) > 0:
+        # No undiscovered path can beat best once the two frontiers together reach it
+        if forward_heap[0][0] + backward_heap[0][0] >= best:
+            break
+        if forward_heap[0][0] <= backward_heap[0][0]:
+            best, meet = _bidirectional_step(forward_heap, indptr, indices, weights, forward_dist, backward_dist,
+                                             forward_settled, pred, blocked_mask, best, meet)
+        else:
+            best, meet = _bidirectional_step(backward_heap, rindptr, rindices, rweights, backward_dist, forward_dist,
+                                             backward_settled, succ, blocked_mask, best, meet)
+
+    return best, meet, pred, succ
+
+def bidirectional_path(pred: np.ndarray, succ: np.ndarray, src: int, dst: int, meet: int) -> List[int]:
+    """Join the forward and backward halves of a bidirectional search at the meeting node"""
+    if meet < 0:
+        return []
+    path = reconstruct_path(pred, src, meet)
+    while path[-1] != dst:
+        path.append(int(succ[path[-1]]))
+    return path
+
+def reconstruct_path(pred: np.ndarray, src: int, dst: int) -> List[int]:
+    """Walk a predecessor array back from dst; empty when dst was never reached"""
+    if dst != src and pred[dst] < 0:
+        return []
+    path = [dst]
+    while path[-1] != src:
+        path.append(int(pred[path[-1]]))
+    path.reverse()
+    return path
@@ -0,0 +1,54 @@
+"""
+Bulk Haversine distance kernels for DisasterOps
+"""
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; haversine_distances falls back to NumPy broadcasting
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+EARTH_RADIUS_KM = 6371
+
+# Serial on purpose: numba's parallel workqueue deadlocks at interpreter exit when first
+# launched from a worker thread, which is where FastAPI and its test client may run us
+@njit(fastmath=True, cache=True, nogil=True)
+def haversine_block(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray, out: np.ndarray):
+    """Fill out[i, j] with the distance in km from point i of (lat1, lng1) to point j of (lat2, lng2)"""
+    # Radians and latitude cosines once per point, leaving two sines per pair
+    lat1_rad, lng1_rad = np.radians(lat1), np.radians(lng1)
+    lat2_rad, lng2_rad = np.radians(lat2), np.radians(lng2)
+    cos_lat1, cos_lat2 = np.cos(lat1_rad), np.cos(lat2_rad)
+    for i in range(lat1.shape[0]):
+        for j in range(lat2.shape[0]):
+            a = (np.sin((lat2_rad[j] - lat1_rad[i]) / 2) ** 2
+                 + cos_lat1[i] * cos_lat2[j] * np.sin((lng2_rad[j] - lng1_rad[i]) / 2) ** 2)
+            a = min(a, 1.0)  # fastmath rounding can push antipodal points just past 1
+            out[i, j] = EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+def haversine_distances(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray) -> np.ndarray:
+    """Haversine distances in km from every point of (lat1, lng1) to every point of (lat2, lng2), as an N x M matrix"""
+    lat1, lng1, lat2, lng2 = (np.asarray(x, dtype=np.float64) for x in (lat1, lng1, lat2, lng2))
+    if _NUMBA_AVAILABLE:
+        out = np.empty((lat1.shape[0], lat2.shape[0]))
+        haversine_block(lat1, lng1, lat2, lng2, out)
+        return out
+
+    lat1_rad, lng1_rad = np.radians(lat1), np.radians(lng1)
+    lat2_rad, lng2_rad = np.radians(lat2), np.radians(lng2)
+    a = (np.sin((lat2_rad[None, :] - lat1_rad[:, None]) / 2) ** 2
+         + np.cos(lat1_rad)[:, None] * np.cos(lat2_rad)[None, :] * np.sin((lng2_rad[None, :] - lng1_rad[:, None]) / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+def haversine(lat1_rad: float, lng1_rad: float, cos_lat1: float,
+              lat2_rad: float, lng2_rad: float, cos_lat2: float) -> float:
+    """Distance in km between two points given in radians, with their latitude cosines precomputed"""
+    a = math.sin((lat2_rad - lat1_rad) / 2) ** 2 + cos_lat1 * cos_lat2 * math.sin((lng2_rad - lng1_rad) / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
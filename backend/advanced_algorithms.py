@@ -9,9 +9,22 @@ from dataclasses import dataclass
 from enum import Enum
 import heapq
 from scipy.optimize import minimize
-import random
+from scipy.sparse.csgraph import dijkstra
+import os
+from multiprocessing import Pool
 from datetime import datetime, timedelta
 
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; the kernels run as plain Python without it
+    _NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 class Priority(Enum):
     CRITICAL = 5
     HIGH = 4
@@ -35,177 +48,268 @@ class AllocationSolution:
     coverage_score: float
     time_efficiency: float
 
+def _distance_matrix(center_ids: List[str], zone_ids: List[str], road_network: nx.Graph) -> np.ndarray:
+    """Dense (center, zone) shortest-path matrix, computed once per optimization run
+    
+    Runs SciPy's compiled Dijkstra from every center over a CSR export of the road network.
+    Unreachable pairs, and ids missing from the network, are np.inf.
+    """
+    node_idx = {node: i for i, node in enumerate(road_network.nodes)}
+    adjacency = nx.to_scipy_sparse_array(road_network, nodelist=list(node_idx), weight='weight', format='csr')
+    
+    matrix = np.full((len(center_ids), len(zone_ids)), np.inf)
+    rows = [i for i, center_id in enumerate(center_ids) if center_id in node_idx]
+    cols = [j for j, zone_id in enumerate(zone_ids) if zone_id in node_idx]
+    if rows and cols:
+        lengths = dijkstra(adjacency, directed=road_network.is_directed(),
+                           indices=[node_idx[center_ids[i]] for i in rows])
+        matrix[np.ix_(rows, cols)] = lengths[:, [node_idx[zone_ids[j]] for j in cols]]
+    return matrix
+
+@dataclass
+class PrecomputedProblem:
+    """Per-instance lookup tables shared by the GA, SA, and NSGA-II optimizers"""
+    center_ids: List[str]
+    zone_ids: List[str]
+    dist_matrix: np.ndarray  # (center, zone) shortest-path length, np.inf when unreachable
+    match_matrix: np.ndarray  # (center, zone) share of the zone's needs the center can fully supply
+    priority: np.ndarray  # zone priorities, 1 (minimal) to 5 (critical)
+
+def build_problem(relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> PrecomputedProblem:
+    """Precompute everything the optimizers need about one allocation instance
+    
+    Build it once and pass it to several optimizers to avoid repeating the shortest-path work.
+    """
+    center_ids = [c.location.id for c in relief_centers]
+    zone_ids = [z.location.id for z in disaster_zones]
+    center_res = {c.location.id: {r.id: r.quantity for r in c.resources} for c in relief_centers}
+    match_matrix = np.array([[_resource_match(center_res[c.location.id], zone)
+                              for zone in disaster_zones] for c in relief_centers], dtype=np.float64)
+    
+    return PrecomputedProblem(
+        center_ids=center_ids,
+        zone_ids=zone_ids,
+        dist_matrix=_distance_matrix(center_ids, zone_ids, road_network),
+        match_matrix=match_matrix.reshape(len(center_ids), len(zone_ids)),
+        priority=np.array([zone.priority for zone in disaster_zones], dtype=np.float64)
+    )
+
+def _resource_match(center_resources: Dict[str, int], zone) -> float:
+    """Calculate how well a center's resources match a zone's needs"""
+    total_match = sum(1 for needed in zone.resources_needed
+                      if center_resources.get(needed.id, 0) >= needed.quantity)
+    
+    return total_match / max(len(zone.resources_needed), 1)
+
+@njit(cache=True)
+def _fitness_kernel(assignment: np.ndarray, dist_matrix: np.ndarray, match_matrix: np.ndarray,
+                    priority_weight: np.ndarray) -> Tuple[float, float]:
+    """GA fitness and total distance of one assignment vector over the precomputed (center, zone) matrices
+    
+    The matrices already carry the unreachable-pair penalty, so the loop has no branches.
+    """
+    total_distance = 0.0
+    coverage_score = 0.0
+    resource_efficiency = 0.0
+    
+    for zone in range(assignment.shape[0]):
+        center = assignment[zone]
+        total_distance += dist_matrix[center, zone]
+        
+        # Coverage weighted by zone priority, efficiency by raw resource match
+        resource_match = match_matrix[center, zone]
+        coverage_score += priority_weight[zone] * resource_match
+        resource_efficiency += resource_match
+    
+    # Fitness function: maximize coverage and efficiency, minimize distance
+    fitness = (coverage_score * 0.5 + resource_efficiency * 0.3) - (total_distance * 0.2)
+    return fitness, total_distance
+
+@njit(cache=True)
+def _population_fitness_kernel(population: np.ndarray, dist_matrix: np.ndarray, match_matrix: np.ndarray,
+                               priority_weight: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    fitness = np.empty(population.shape[0])
+    total_distance = np.empty(population.shape[0])
+    for i in range(population.shape[0]):
+        fitness[i], total_distance[i] = _fitness_kernel(population[i], dist_matrix, match_matrix, priority_weight)
+    return fitness, total_distance
+
+def _population_fitness(population: np.ndarray, dist_matrix: np.ndarray, match_matrix: np.ndarray,
+                        priority_weight: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """GA fitness and total distance of every row of a (P, Z) population"""
+    if _NUMBA_AVAILABLE:
+        # Compiled row loop fuses the gathers and sums without (P, Z) temporaries
+        return _population_fitness_kernel(population, dist_matrix, match_matrix, priority_weight)
+    
+    # Gather each individual's (center, zone) entries with one fancy-index per matrix
+    zones = np.arange(population.shape[1])
+    matches = match_matrix[population, zones]
+    
+    total_distance = dist_matrix[population, zones].sum(axis=1)
+    coverage_score = (matches * priority_weight).sum(axis=1)
+    resource_efficiency = matches.sum(axis=1)
+    
+    fitness = (coverage_score * 0.5 + resource_efficiency * 0.3) - (total_distance * 0.2)
+    return fitness, total_distance
+
+# Per-process state for pooled fitness evaluation, filled in once by the pool initializer
+_worker_state: Dict = {}
+
+def _init_worker(evaluate, *args):
+    """Pool initializer: keep the evaluation function and lookup tables resident in each worker"""
+    _worker_state['evaluate'] = evaluate
+    _worker_state['args'] = args
+
+def _evaluate_worker(item):
+    return _worker_state['evaluate'](item, *_worker_state['args'])
+
+def _worker_count(n_workers: Optional[int]) -> int:
+    return n_workers or os.cpu_count() or 1
+
+def _open_pool(n_workers: Optional[int], evaluate, *args) -> Optional[Pool]:
+    """Start a worker pool for population evaluation, or None to evaluate in-process"""
+    n_workers = _worker_count(n_workers)
+    if n_workers <= 1:
+        return None
+    return Pool(n_workers, initializer=_init_worker, initargs=(evaluate, *args))
+
 class GeneticAlgorithmOptimizer:
     """Genetic Algorithm for complex resource allocation optimization"""
     
-    def __init__(self, population_size: int = 50, generations: int = 100, mutation_rate: float = 0.1):
+    def __init__(self, population_size: int = 50, generations: int = 100, mutation_rate: float = 0.1,
+                 n_workers: Optional[int] = 1, patience: Optional[int] = 20, seed: Optional[int] = None):
         self.population_size = population_size
         self.generations = generations
         self.mutation_rate = mutation_rate
+        self.n_workers = n_workers  # processes for fitness evaluation; None = one per CPU
+        self.patience = patience  # stop after this many generations without improvement; None = never
+        self._rng = np.random.default_rng(seed)
     
-    def optimize_allocation(self, relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> AllocationSolution:
+    def optimize_allocation(self, relief_centers: List, disaster_zones: List, road_network: nx.Graph,
+                            problem: Optional[PrecomputedProblem] = None) -> AllocationSolution:
         """Use genetic algorithm to find optimal resource allocation"""
         
+        # Shortest paths and resource matches don't change between generations
+        if problem is None:
+            problem = build_problem(relief_centers, disaster_zones, road_network)
+        
+        # Individuals are int32 arrays: entry i is the index of the center serving zone i
+        center_ids = problem.center_ids
+        zone_ids = problem.zone_ids
+        priority_weight = problem.priority / 5.0
+        
+        # Fold the unreachable penalty into the matrices: fixed distance cost, no resource match
+        reachable = np.isfinite(problem.dist_matrix)
+        match_matrix = np.where(reachable, problem.match_matrix, 0.0)
+        dist_matrix = np.where(reachable, problem.dist_matrix, 1000.0)
+        
         # Initialize population
         population = self._initialize_population(relief_centers, disaster_zones)
         
         best_solution = None
         best_fitness = float('-inf')
-        
-        for generation in range(self.generations):
-            # Evaluate fitness for each individual
-            fitness_scores = []
-            for individual in population:
-                fitness = self._evaluate_fitness(individual, relief_centers, disaster_zones, road_network)
-                fitness_scores.append(fitness)
+        best_total_cost = 0.0
+        stagnation = 0
+        
+        pool = _open_pool(self.n_workers, self._evaluate_fitness, dist_matrix, match_matrix, priority_weight)
+        try:
+            for generation in range(self.generations):
+                # Evaluate fitness for the whole population at once
+                if pool is None:
+                    fitness_scores, total_costs = self._evaluate_fitness(population, dist_matrix, match_matrix, priority_weight)
+                else:
+                    chunks = np.array_split(population, _worker_count(self.n_workers))
+                    results = pool.map(_evaluate_worker, chunks)
+                    fitness_scores = np.concatenate([fitness for fitness, _ in results])
+                    total_costs = np.concatenate([cost for _, cost in results])
                 
-                if fitness > best_fitness:
-                    best_fitness = fitness
-                    best_solution = individual
-            
-            # Selection, crossover, and mutation
-            population = self._evolve_population(population, fitness_scores)
-            
-            # Log progress every 20 generations
-            if generation % 20 == 0:
-                print(f"Generation {generation}: Best fitness = {best_fitness:.4f}")
-        
-        return self._convert_to_solution(best_solution, relief_centers, disaster_zones, road_network)
-    
-    def _initialize_population(self, relief_centers: List, disaster_zones: List) -> List[Dict]:
-        """Initialize random population of allocation strategies"""
-        population = []
-        
-        for _ in range(self.population_size):
-            individual = {}
-            for zone in disaster_zones:
-                # Randomly assign a relief center to each disaster zone
-                assigned_center = random.choice(relief_centers)
-                individual[zone.location.id] = assigned_center.location.id
-            population.append(individual)
-        
-        return population
-    
-    def _evaluate_fitness(self, individual: Dict, relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> float:
-        """Evaluate fitness of an allocation strategy"""
-        total_distance = 0
-        coverage_score = 0
-        resource_efficiency = 0
-        
-        for zone_id, center_id in individual.items():
-            zone = next(z for z in disaster_zones if z.location.id == zone_id)
-            center = next(c for c in relief_centers if c.location.id == center_id)
-            
-            try:
-                # Calculate distance cost
-                distance = nx.shortest_path_length(road_network, center_id, zone_id, weight='weight')
-                total_distance += distance
+                best_idx = int(np.argmax(fitness_scores))
+                stagnation = 0 if fitness_scores[best_idx] - best_fitness >= 1e-6 else stagnation + 1
+                if fitness_scores[best_idx] > best_fitness:
+                    best_fitness = float(fitness_scores[best_idx])
+                    best_total_cost = float(total_costs[best_idx])
+                    best_solution = population[best_idx].copy()
                 
-                # Calculate coverage score based on priority and resources
-                priority_weight = zone.priority / 5.0
-                resource_match = self._calculate_resource_match(center, zone)
-                coverage_score += priority_weight * resource_match
+                # Log progress every 20 generations
+                if generation % 20 == 0:
+                    print(f"Generation {generation}: Best fitness = {best_fitness:.4f}")
                 
-                # Resource efficiency (how well center resources match zone needs)
-                resource_efficiency += resource_match
+                # Halt once the best fitness has plateaued
+                if self.patience is not None and stagnation >= self.patience:
+                    print(f"Generation {generation}: No improvement for {stagnation} generations, stopping")
+                    break
                 
-            except nx.NetworkXNoPath:
-                # Penalize unreachable assignments
-                total_distance += 1000
-        
-        # Fitness function: maximize coverage and efficiency, minimize distance
-        fitness = (coverage_score * 0.5 + resource_efficiency * 0.3) - (total_distance * 0.2)
-        return fitness
+                # Selection, crossover, and mutation
+                population = self._evolve_population(population, fitness_scores, len(center_ids))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        
+        return self._convert_to_solution(best_solution, center_ids, zone_ids, best_fitness, best_total_cost)
     
-    def _calculate_resource_match(self, center, zone) -> float:
-        """Calculate how well a center's resources match a zone's needs"""
-        total_match = 0
-        total_needed = len(zone.resources_needed)
-        
-        for needed_resource in zone.resources_needed:
-            center_resource = next((r for r in center.resources if r.id == needed_resource.id), None)
-            if center_resource and center_resource.quantity >= needed_resource.quantity:
-                total_match += 1
-        
-        return total_match / max(total_needed, 1)
+    def _initialize_population(self, relief_centers: List, disaster_zones: List) -> np.ndarray:
+        """Initialize random (population_size, n_zones) population of allocation strategies"""
+        # Randomly assign a relief center to each disaster zone
+        return self._rng.integers(0, len(relief_centers), size=(self.population_size, len(disaster_zones)),
+                                  dtype=np.int32)
+    
+    def _evaluate_fitness(self, population: np.ndarray, dist_matrix: np.ndarray, match_matrix: np.ndarray,
+                          priority_weight: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate fitness (and total distance) of every allocation strategy in the population"""
+        return _population_fitness(population, dist_matrix, match_matrix, priority_weight)
     
-    def _evolve_population(self, population: List[Dict], fitness_scores: List[float]) -> List[Dict]:
+    def _evolve_population(self, population: np.ndarray, fitness_scores: np.ndarray, n_centers: int) -> np.ndarray:
         """Evolve population through selection, crossover, and mutation"""
-        new_population = []
-        
-        # Keep best individuals (elitism)
+        # Keep best individuals (elitism); only the top-k set matters, not its order
         elite_count = int(0.1 * self.population_size)
-        elite_indices = np.argsort(fitness_scores)[-elite_count:]
-        for idx in elite_indices:
-            new_population.append(population[idx].copy())
-        
-        # Generate rest through crossover and mutation
-        while len(new_population) < self.population_size:
-            # Tournament selection
-            parent1 = self._tournament_selection(population, fitness_scores)
-            parent2 = self._tournament_selection(population, fitness_scores)
-            
-            # Crossover
-            child = self._crossover(parent1, parent2)
-            
-            # Mutation
-            if random.random() < self.mutation_rate:
-                child = self._mutate(child, population)
-            
-            new_population.append(child)
+        elite_indices = np.argpartition(fitness_scores, -elite_count)[-elite_count:] if elite_count > 0 else np.arange(0)
+        
+        # Generate rest through crossover and mutation, one batch per generation
+        n_offspring = self.population_size - elite_count
+        parents = self._tournament_selection(fitness_scores, n_offspring)
+        children = self._crossover(population[parents[:, 0]], population[parents[:, 1]])
         
-        return new_population
+        for child_idx in np.flatnonzero(self._rng.random(n_offspring) < self.mutation_rate):
+            children[child_idx] = self._mutate(children[child_idx], n_centers)
+        
+        return np.concatenate((population[elite_indices], children)).astype(np.int32, copy=False)
     
-    def _tournament_selection(self, population: List[Dict], fitness_scores: List[float]) -> Dict:
-        """Select individual using tournament selection"""
+    def _tournament_selection(self, fitness_scores: np.ndarray, n_offspring: int) -> np.ndarray:
+        """Select (n_offspring, 2) parent indices using tournament selection
+        
+        All tournaments of a generation are drawn in one batch; contestants are sampled with replacement.
+        """
         tournament_size = 3
-        tournament_indices = random.sample(range(len(population)), tournament_size)
-        best_idx = max(tournament_indices, key=lambda i: fitness_scores[i])
-        return population[best_idx]
-    
-    def _crossover(self, parent1: Dict, parent2: Dict) -> Dict:
-        """Create child through crossover of two parents"""
-        child = {}
-        for zone_id in parent1.keys():
-            # Randomly choose assignment from either parent
-            child[zone_id] = random.choice([parent1[zone_id], parent2[zone_id]])
-        return child
-    
-    def _mutate(self, individual: Dict, population: List[Dict]) -> Dict:
+        contestants = self._rng.integers(0, len(fitness_scores), size=(n_offspring, 2, tournament_size))
+        winners = np.argmax(fitness_scores[contestants], axis=2)
+        return np.take_along_axis(contestants, winners[..., np.newaxis], axis=2)[..., 0]
+    
+    def _crossover(self, parent1: np.ndarray, parent2: np.ndarray) -> np.ndarray:
+        """Create children through uniform crossover of paired parents (rows or single individuals)"""
+        # Randomly choose each assignment from either parent
+        mask = self._rng.integers(0, 2, size=parent1.shape, dtype=bool)
+        return np.where(mask, parent1, parent2)
+    
+    def _mutate(self, individual: np.ndarray, n_centers: int) -> np.ndarray:
         """Mutate individual by randomly changing some assignments"""
         mutated = individual.copy()
-        zone_ids = list(individual.keys())
-        
-        # Mutate 1-2 random assignments
-        num_mutations = random.randint(1, 2)
-        for _ in range(num_mutations):
-            zone_id = random.choice(zone_ids)
-            # Get all possible center assignments from population
-            possible_centers = set()
-            for ind in population:
-                possible_centers.add(ind[zone_id])
-            mutated[zone_id] = random.choice(list(possible_centers))
+        
+        # Mutate 1-2 random assignments to any relief center
+        num_mutations = self._rng.integers(1, 3)
+        zone_indices = self._rng.integers(0, len(mutated), size=num_mutations)
+        mutated[zone_indices] = self._rng.integers(0, n_centers, size=num_mutations)
         
         return mutated
     
-    def _convert_to_solution(self, best_individual: Dict, relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> AllocationSolution:
+    def _convert_to_solution(self, best_individual: np.ndarray, center_ids: List[str], zone_ids: List[str],
+                             best_fitness: float, total_cost: float) -> AllocationSolution:
         """Convert best individual to AllocationSolution format"""
         allocations = {}
-        routes = []
-        total_cost = 0
+        routes = [(center_ids[center_idx], zone_ids[zone_idx]) for zone_idx, center_idx in enumerate(best_individual)]
         
-        for zone_id, center_id in best_individual.items():
-            routes.append((center_id, zone_id))
-            
-            # Calculate cost
-            try:
-                cost = nx.shortest_path_length(road_network, center_id, zone_id, weight='weight')
-                total_cost += cost
-            except nx.NetworkXNoPath:
-                total_cost += 1000
-        
-        # Calculate coverage and efficiency scores
-        coverage_score = self._evaluate_fitness(best_individual, relief_centers, disaster_zones, road_network)
+        # Coverage is the fitness and cost the total distance already computed in the GA loop
+        coverage_score = best_fitness
         time_efficiency = 1.0 / (1.0 + total_cost / len(routes))
         
         return AllocationSolution(
@@ -219,80 +323,103 @@ class GeneticAlgorithmOptimizer:
 class SimulatedAnnealingOptimizer:
     """Simulated Annealing for resource allocation optimization"""
     
-    def __init__(self, initial_temp: float = 1000, cooling_rate: float = 0.95, min_temp: float = 1):
+    def __init__(self, initial_temp: float = 1000, cooling_rate: float = 0.95, min_temp: float = 1,
+                 patience: Optional[int] = 50, seed: Optional[int] = None):
         self.initial_temp = initial_temp
         self.cooling_rate = cooling_rate
         self.min_temp = min_temp
+        self.patience = patience  # stop after this many steps without a new best; None = never
+        self._rng = np.random.default_rng(seed)
     
-    def optimize(self, relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> AllocationSolution:
+    def optimize(self, relief_centers: List, disaster_zones: List, road_network: nx.Graph,
+                 problem: Optional[PrecomputedProblem] = None) -> AllocationSolution:
         """Use simulated annealing to optimize resource allocation"""
         
+        # Shortest paths over the road network don't change while annealing
+        if problem is None:
+            problem = build_problem(relief_centers, disaster_zones, road_network)
+        
+        # Solutions are int32 arrays: entry i is the index of the center serving zone i
+        center_ids = problem.center_ids
+        zone_ids = problem.zone_ids
+        
+        # Cost of serving each zone from each center, so a move is scored by its delta alone
+        assignment_costs = self._assignment_costs(problem)
+        
         # Initialize with random solution
         current_solution = self._random_solution(relief_centers, disaster_zones)
-        current_cost = self._calculate_cost(current_solution, relief_centers, disaster_zones, road_network)
+        current_cost = self._calculate_cost(current_solution, assignment_costs)
         
         best_solution = current_solution.copy()
         best_cost = current_cost
         
         temperature = self.initial_temp
+        no_improve = 0
         
         while temperature > self.min_temp:
-            # Generate neighbor solution
-            neighbor_solution = self._generate_neighbor(current_solution, relief_centers)
-            neighbor_cost = self._calculate_cost(neighbor_solution, relief_centers, disaster_zones, road_network)
+            # Generate neighbor solution; only the changed assignments affect its cost
+            neighbor_solution, changes = self._generate_neighbor(current_solution, relief_centers)
+            neighbor_cost = current_cost + sum(
+                assignment_costs[new_center, zone_idx] - assignment_costs[old_center, zone_idx]
+                for zone_idx, old_center, new_center in changes
+            )
             
             # Accept or reject neighbor
+            improved = False
             if self._accept_solution(current_cost, neighbor_cost, temperature):
                 current_solution = neighbor_solution
                 current_cost = neighbor_cost
                 
                 # Update best solution
                 if neighbor_cost < best_cost:
+                    improved = best_cost - neighbor_cost >= 1e-6
                     best_solution = neighbor_solution.copy()
                     best_cost = neighbor_cost
             
+            # Halt once the best cost has plateaued
+            no_improve = 0 if improved else no_improve + 1
+            if self.patience is not None and no_improve >= self.patience:
+                break
+            
             # Cool down
             temperature *= self.cooling_rate
         
-        return self._convert_to_allocation_solution(best_solution, relief_centers, disaster_zones, road_network)
+        return self._convert_to_allocation_solution(best_solution, center_ids, zone_ids, assignment_costs)
     
-    def _random_solution(self, relief_centers: List, disaster_zones: List) -> Dict:
+    def _random_solution(self, relief_centers: List, disaster_zones: List) -> np.ndarray:
         """Generate random initial solution"""
-        solution = {}
-        for zone in disaster_zones:
-            solution[zone.location.id] = random.choice(relief_centers).location.id
-        return solution
+        return self._rng.integers(0, len(relief_centers), size=len(disaster_zones), dtype=np.int32)
     
-    def _generate_neighbor(self, solution: Dict, relief_centers: List) -> Dict:
-        """Generate neighbor solution by changing 1-2 assignments"""
+    def _generate_neighbor(self, solution: np.ndarray, relief_centers: List) -> Tuple[np.ndarray, List[Tuple[int, int, int]]]:
+        """Generate neighbor solution by changing 1-2 assignments
+        
+        Also returns the applied (zone_idx, old_center_idx, new_center_idx) changes in order.
+        """
         neighbor = solution.copy()
-        zone_ids = list(solution.keys())
+        changes = []
         
-        # Change 1-2 random assignments
-        num_changes = random.randint(1, 2)
-        for _ in range(num_changes):
-            zone_id = random.choice(zone_ids)
-            neighbor[zone_id] = random.choice(relief_centers).location.id
+        # Change 1-2 random assignments, drawing all indices in one batch
+        num_changes = self._rng.integers(1, 3)
+        zone_indices = self._rng.integers(0, len(solution), size=num_changes)
+        center_indices = self._rng.integers(0, len(relief_centers), size=num_changes)
+        for zone_idx, center_idx in zip(zone_indices, center_indices):
+            changes.append((zone_idx, neighbor[zone_idx], center_idx))
+            neighbor[zone_idx] = center_idx
         
-        return neighbor
+        return neighbor, changes
     
-    def _calculate_cost(self, solution: Dict, relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> float:
+    def _assignment_costs(self, problem: PrecomputedProblem) -> np.ndarray:
+        """Cost of assigning each center to each zone as a (center, zone) matrix"""
+        # Cost includes distance and priority weight
+        priority_multiplier = (6 - problem.priority) / 5.0  # Higher priority = lower cost multiplier
+        
+        # High penalty for unreachable zones
+        dist_matrix = problem.dist_matrix
+        return np.where(np.isinf(dist_matrix), 10000.0, dist_matrix * priority_multiplier)
+    
+    def _calculate_cost(self, solution: np.ndarray, assignment_costs: np.ndarray) -> float:
         """Calculate total cost of a solution"""
-        total_cost = 0
-        
-        for zone_id, center_id in solution.items():
-            try:
-                distance = nx.shortest_path_length(road_network, center_id, zone_id, weight='weight')
-                zone = next(z for z in disaster_zones if z.location.id == zone_id)
-                
-                # Cost includes distance and priority weight
-                priority_multiplier = (6 - zone.priority) / 5.0  # Higher priority = lower cost multiplier
-                total_cost += distance * priority_multiplier
-                
-            except nx.NetworkXNoPath:
-                total_cost += 10000  # High penalty for unreachable zones
-        
-        return total_cost
+        return float(assignment_costs[solution, np.arange(len(solution))].sum())
     
     def _accept_solution(self, current_cost: float, neighbor_cost: float, temperature: float) -> bool:
         """Decide whether to accept neighbor solution"""
@@ -301,12 +428,13 @@ class SimulatedAnnealingOptimizer:
         
         # Accept worse solution with probability based on temperature
         probability = np.exp(-(neighbor_cost - current_cost) / temperature)
-        return random.random() < probability
+        return self._rng.random() < probability
     
-    def _convert_to_allocation_solution(self, solution: Dict, relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> AllocationSolution:
+    def _convert_to_allocation_solution(self, solution: np.ndarray, center_ids: List[str], zone_ids: List[str],
+                                        assignment_costs: np.ndarray) -> AllocationSolution:
         """Convert solution to AllocationSolution format"""
-        routes = [(center_id, zone_id) for zone_id, center_id in solution.items()]
-        total_cost = self._calculate_cost(solution, relief_centers, disaster_zones, road_network)
+        routes = [(center_ids[center_idx], zone_ids[zone_idx]) for zone_idx, center_idx in enumerate(solution)]
+        total_cost = self._calculate_cost(solution, assignment_costs)
         
         return AllocationSolution(
             allocations={},
@@ -319,160 +447,161 @@ class SimulatedAnnealingOptimizer:
 class MultiObjectiveOptimizer:
     """Multi-objective optimization using NSGA-II algorithm"""
     
-    def __init__(self, population_size: int = 50, generations: int = 100):
+    def __init__(self, population_size: int = 50, generations: int = 100, n_workers: Optional[int] = 1,
+                 seed: Optional[int] = None):
         self.population_size = population_size
         self.generations = generations
+        self.n_workers = n_workers  # processes for objective evaluation; None = one per CPU
+        self._rng = np.random.default_rng(seed)
     
-    def optimize(self, relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> List[AllocationSolution]:
+    def optimize(self, relief_centers: List, disaster_zones: List, road_network: nx.Graph,
+                 problem: Optional[PrecomputedProblem] = None) -> List[AllocationSolution]:
         """Return Pareto-optimal solutions for multiple objectives"""
         
+        # Shortest paths and resource matches don't change between generations
+        if problem is None:
+            problem = build_problem(relief_centers, disaster_zones, road_network)
+        
+        # Individuals are rows of a (P, n_zones) int32 array of center indices
+        center_ids = problem.center_ids
+        zone_ids = problem.zone_ids
+        
+        # Coverage based on resource availability and priority, per (center, zone) assignment
+        coverage_matrix = problem.match_matrix * problem.priority
+        
+        # Unreachable assignments cost a flat penalty and contribute no coverage or speed
+        reachable = np.isfinite(problem.dist_matrix)
+        coverage_matrix = np.where(reachable, coverage_matrix, 0.0)
+        speed_matrix = np.where(reachable, 1.0 / (1.0 + problem.dist_matrix), 0.0)  # inverse of distance
+        dist_matrix = np.where(reachable, problem.dist_matrix, 1000.0)
+        
         # Initialize population
         population = self._initialize_population(relief_centers, disaster_zones)
         
-        for generation in range(self.generations):
-            # Evaluate objectives for each individual
-            objectives = []
-            for individual in population:
-                obj = self._evaluate_objectives(individual, relief_centers, disaster_zones, road_network)
-                objectives.append(obj)
-            
-            # Non-dominated sorting and crowding distance
-            fronts = self._non_dominated_sort(objectives)
-            population = self._select_next_generation(population, objectives, fronts)
+        objectives = None
+        pool = _open_pool(self.n_workers, self._evaluate_objectives, dist_matrix, coverage_matrix, speed_matrix)
+        try:
+            for generation in range(self.generations):
+                # Evaluate objectives for the whole population at once
+                if pool is None:
+                    objectives = self._evaluate_objectives(population, dist_matrix, coverage_matrix, speed_matrix)
+                else:
+                    chunks = np.array_split(population, _worker_count(self.n_workers))
+                    objectives = np.concatenate(pool.map(_evaluate_worker, chunks))
+                
+                # Non-dominated sorting and crowding distance; survivors keep their objectives
+                fronts = self._non_dominated_sort(objectives)
+                selected = self._select_next_generation(objectives, fronts)
+                population = population[selected]
+                objectives = objectives[selected]
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        
+        if objectives is None:
+            objectives = self._evaluate_objectives(population, dist_matrix, coverage_matrix, speed_matrix)
         
         # Return Pareto front solutions
-        final_objectives = [self._evaluate_objectives(ind, relief_centers, disaster_zones, road_network) for ind in population]
-        pareto_front = self._get_pareto_front(population, final_objectives)
-        
-        return [self._convert_to_solution(sol, relief_centers, disaster_zones, road_network) for sol in pareto_front]
-    
-    def _initialize_population(self, relief_centers: List, disaster_zones: List) -> List[Dict]:
-        """Initialize random population"""
-        population = []
-        for _ in range(self.population_size):
-            individual = {}
-            for zone in disaster_zones:
-                individual[zone.location.id] = random.choice(relief_centers).location.id
-            population.append(individual)
-        return population
-    
-    def _evaluate_objectives(self, individual: Dict, relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> Tuple[float, float, float]:
-        """Evaluate multiple objectives: minimize cost, maximize coverage, maximize speed"""
-        total_cost = 0
-        coverage_score = 0
-        speed_score = 0
-        
-        for zone_id, center_id in individual.items():
-            zone = next(z for z in disaster_zones if z.location.id == zone_id)
-            center = next(c for c in relief_centers if c.location.id == center_id)
-            
-            try:
-                distance = nx.shortest_path_length(road_network, center_id, zone_id, weight='weight')
-                total_cost += distance
-                
-                # Coverage based on resource availability and priority
-                resource_match = sum(1 for needed in zone.resources_needed 
-                                   if any(r.id == needed.id and r.quantity >= needed.quantity for r in center.resources))
-                coverage_score += (resource_match / len(zone.resources_needed)) * zone.priority
-                
-                # Speed score (inverse of distance)
-                speed_score += 1.0 / (1.0 + distance)
-                
-            except nx.NetworkXNoPath:
-                total_cost += 1000
+        pareto_front = self._get_pareto_front(objectives)
         
-        return (total_cost, -coverage_score, -speed_score)  # Minimize all objectives
+        return [self._convert_to_solution(population[i], center_ids, zone_ids, objectives[i])
+                for i in pareto_front]
+    
+    def _initialize_population(self, relief_centers: List, disaster_zones: List) -> np.ndarray:
+        """Initialize random (population_size, n_zones) population"""
+        return self._rng.integers(0, len(relief_centers), size=(self.population_size, len(disaster_zones)),
+                                  dtype=np.int32)
+    
+    def _evaluate_objectives(self, population: np.ndarray, dist_matrix: np.ndarray, coverage_matrix: np.ndarray,
+                             speed_matrix: np.ndarray) -> np.ndarray:
+        """Evaluate multiple objectives: minimize cost, maximize coverage, maximize speed
+        
+        Returns a (P, 3) array with one row of objectives per individual.
+        """
+        zones = np.arange(population.shape[1])
+        total_cost = dist_matrix[population, zones].sum(axis=1)
+        coverage_score = coverage_matrix[population, zones].sum(axis=1)
+        speed_score = speed_matrix[population, zones].sum(axis=1)
+        
+        return np.column_stack((total_cost, -coverage_score, -speed_score))  # Minimize all objectives
     
     def _non_dominated_sort(self, objectives: List[Tuple[float, float, float]]) -> List[List[int]]:
         """Perform non-dominated sorting"""
-        n = len(objectives)
-        domination_count = [0] * n
-        dominated_solutions = [[] for _ in range(n)]
-        fronts = [[]]
-        
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    if self._dominates(objectives[i], objectives[j]):
-                        dominated_solutions[i].append(j)
-                    elif self._dominates(objectives[j], objectives[i]):
-                        domination_count[i] += 1
-            
-            if domination_count[i] == 0:
-                fronts[0].append(i)
-        
-        front_idx = 0
-        while len(fronts[front_idx]) > 0:
-            next_front = []
-            for i in fronts[front_idx]:
-                for j in dominated_solutions[i]:
-                    domination_count[j] -= 1
-                    if domination_count[j] == 0:
-                        next_front.append(j)
-            front_idx += 1
-            fronts.append(next_front)
-        
-        return fronts[:-1]  # Remove empty last front
-    
-    def _dominates(self, obj1: Tuple[float, float, float], obj2: Tuple[float, float, float]) -> bool:
-        """Check if obj1 dominates obj2"""
-        return all(o1 <= o2 for o1, o2 in zip(obj1, obj2)) and any(o1 < o2 for o1, o2 in zip(obj1, obj2))
-    
-    def _select_next_generation(self, population: List[Dict], objectives: List[Tuple], fronts: List[List[int]]) -> List[Dict]:
-        """Select next generation using NSGA-II selection"""
-        new_population = []
+        obj = np.asarray(objectives, dtype=np.float64)
+        
+        # dominates[i, j] is True when solution i dominates solution j
+        dominates = self._dominates(obj[:, np.newaxis, :], obj[np.newaxis, :, :])
+        domination_count = dominates.sum(axis=0)
+        
+        fronts = []
+        front = np.flatnonzero(domination_count == 0)
+        while front.size > 0:
+            fronts.append(front.tolist())
+            # Peel off the current front and release everything it dominated
+            domination_count -= dominates[front].sum(axis=0)
+            domination_count[front] = -1
+            front = np.flatnonzero(domination_count == 0)
+        
+        return fronts
+    
+    def _dominates(self, obj1, obj2):
+        """Check if obj1 dominates obj2 (broadcasts over leading axes of objective arrays)"""
+        obj1 = np.asarray(obj1, dtype=np.float64)
+        obj2 = np.asarray(obj2, dtype=np.float64)
+        return (obj1 <= obj2).all(axis=-1) & (obj1 < obj2).any(axis=-1)
+    
+    def _select_next_generation(self, objectives: np.ndarray, fronts: List[List[int]]) -> List[int]:
+        """Select indices of the next generation using NSGA-II selection"""
+        selected = []
         
         for front in fronts:
-            if len(new_population) + len(front) <= self.population_size:
-                new_population.extend([population[i] for i in front])
+            if len(selected) + len(front) <= self.population_size:
+                selected.extend(front)
             else:
                 # Calculate crowding distance and select best
-                remaining = self.population_size - len(new_population)
-                crowding_distances = self._calculate_crowding_distance([objectives[i] for i in front])
-                sorted_indices = sorted(range(len(front)), key=lambda i: crowding_distances[i], reverse=True)
-                new_population.extend([population[front[sorted_indices[i]]] for i in range(remaining)])
+                remaining = self.population_size - len(selected)
+                crowding_distances = self._calculate_crowding_distance(np.asarray(objectives)[front])
+                sorted_indices = np.argsort(-crowding_distances, kind='stable')[:remaining]
+                selected.extend(front[i] for i in sorted_indices)
                 break
         
-        return new_population
+        return selected
     
-    def _calculate_crowding_distance(self, front_objectives: List[Tuple]) -> List[float]:
-        """Calculate crowding distance for a front"""
-        n = len(front_objectives)
-        distances = [0.0] * n
+    def _calculate_crowding_distance(self, front_objectives: np.ndarray) -> np.ndarray:
+        """Calculate crowding distance for a front given its (n, M) objectives"""
+        front_objectives = np.asarray(front_objectives, dtype=np.float64)
+        distances = np.zeros(len(front_objectives))
         
-        for obj_idx in range(len(front_objectives[0])):
+        for obj_idx in range(front_objectives.shape[1]):
             # Sort by objective value
-            sorted_indices = sorted(range(n), key=lambda i: front_objectives[i][obj_idx])
+            sorted_indices = np.argsort(front_objectives[:, obj_idx], kind='stable')
+            sorted_values = front_objectives[sorted_indices, obj_idx]
             
-            # Set boundary points to infinity
-            distances[sorted_indices[0]] = float('inf')
-            distances[sorted_indices[-1]] = float('inf')
-            
-            # Calculate distances for intermediate points
-            obj_range = front_objectives[sorted_indices[-1]][obj_idx] - front_objectives[sorted_indices[0]][obj_idx]
+            # Calculate distances for intermediate points from their sorted neighbours
+            obj_range = sorted_values[-1] - sorted_values[0]
             if obj_range > 0:
-                for i in range(1, n - 1):
-                    distances[sorted_indices[i]] += (
-                        front_objectives[sorted_indices[i + 1]][obj_idx] - 
-                        front_objectives[sorted_indices[i - 1]][obj_idx]
-                    ) / obj_range
+                distances[sorted_indices[1:-1]] += (sorted_values[2:] - sorted_values[:-2]) / obj_range
+            
+            # Set boundary points to infinity
+            distances[sorted_indices[[0, -1]]] = np.inf
         
         return distances
     
-    def _get_pareto_front(self, population: List[Dict], objectives: List[Tuple]) -> List[Dict]:
-        """Get Pareto front solutions"""
+    def _get_pareto_front(self, objectives: List[Tuple]) -> List[int]:
+        """Get indices of the Pareto front solutions"""
         fronts = self._non_dominated_sort(objectives)
-        return [population[i] for i in fronts[0]]
+        return fronts[0]
     
-    def _convert_to_solution(self, individual: Dict, relief_centers: List, disaster_zones: List, road_network: nx.Graph) -> AllocationSolution:
+    def _convert_to_solution(self, individual: np.ndarray, center_ids: List[str], zone_ids: List[str],
+                             objectives: np.ndarray) -> AllocationSolution:
         """Convert individual to AllocationSolution"""
-        routes = [(center_id, zone_id) for zone_id, center_id in individual.items()]
-        objectives = self._evaluate_objectives(individual, relief_centers, disaster_zones, road_network)
+        routes = [(center_ids[center_idx], zone_ids[zone_idx]) for zone_idx, center_idx in enumerate(individual)]
         
         return AllocationSolution(
             allocations={},
             routes=routes,
-            total_cost=objectives[0],
-            coverage_score=-objectives[1],
-            time_efficiency=-objectives[2]
+            total_cost=float(objectives[0]),
+            coverage_score=float(-objectives[1]),
+            time_efficiency=float(-objectives[2])
         )
@@ -4,8 +4,13 @@ Advanced algorithms for resource allocation and routing optimization
 import networkx as nx
 import numpy as np
 from typing import List, Dict, Tuple
-from pulp import LpMaximize, LpProblem, LpVariable, lpSum, LpStatus, value
 import heapq
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from _csr import build_csr, build_csr_attributes, edge_slots, dijkstra_csr, reconstruct_path
+
+LP_WEIGHT_SCALE = 10 ** 9  # network simplex needs integer costs; priority weights are scaled before rounding
 
 class ResourceAllocator:
     """Implements various resource allocation algorithms"""
@@ -14,11 +19,37 @@ class ResourceAllocator:
         self.relief_centers = relief_centers
         self.disaster_zones = disaster_zones
         self.road_network = road_network
+        self.network_version = 0  # bump after mutating road_network to drop cached distances
+        self._distances = None
+        self._distances_version = None
+    
+    def _center_distances(self) -> np.ndarray:
+        """(center, zone) shortest-path lengths from one Dijkstra run per center; np.inf when unreachable"""
+        if self._distances is None or self._distances_version != self.network_version:
+            indptr, indices, weights, node_to_idx = build_csr(self.road_network)
+            for rc in self.relief_centers:
+                if rc.location.id not in node_to_idx:
+                    raise nx.NodeNotFound(f"Source {rc.location.id} is not in G")
+            
+            # The compiled kernel releases the GIL, so the per-center searches run in parallel threads
+            no_blocks = np.zeros(len(node_to_idx), dtype=np.bool_)
+            sources = [node_to_idx[rc.location.id] for rc in self.relief_centers]
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                rows = list(executor.map(lambda src: dijkstra_csr(indptr, indices, weights, src, -1, no_blocks)[0], sources))
+            all_dists = np.vstack(rows) if rows else np.empty((0, len(node_to_idx)))
+            
+            # Zones missing from the network are unreachable
+            cols = np.array([node_to_idx.get(dz.location.id, -1) for dz in self.disaster_zones], dtype=np.int64)
+            self._distances = np.where(cols >= 0, all_dists[:, cols], np.inf)
+            self._distances_version = self.network_version
+        return self._distances
     
     def min_cost_flow_allocation(self) -> Dict:
         """
         Implement minimum cost flow algorithm for optimal resource allocation
         """
+        dists = self._center_distances()
+        
         # Create flow network
         flow_network = nx.DiGraph()
         
@@ -32,19 +63,17 @@ class ResourceAllocator:
             flow_network.add_edge("source", f"rc_{rc.location.id}", capacity=total_resources, weight=0)
         
         # Add disaster zones as sink nodes
-        for dz in self.disaster_zones:
+        for j, dz in enumerate(self.disaster_zones):
             demand = sum(r.quantity for r in dz.resources_needed)
             flow_network.add_node(f"dz_{dz.location.id}", demand=demand)
             
             # Connect relief centers to disaster zones
-            for rc in self.relief_centers:
-                try:
-                    cost = nx.shortest_path_length(self.road_network, rc.location.id, dz.location.id, weight='weight')
+            for i, rc in enumerate(self.relief_centers):
+                if np.isfinite(dists[i, j]):
+                    cost = dists[i, j]
                     capacity = min(sum(r.quantity for r in rc.resources), demand)
                     flow_network.add_edge(f"rc_{rc.location.id}", f"dz_{dz.location.id}", 
                                         capacity=capacity, weight=cost * dz.priority)
-                except nx.NetworkXNoPath:
-                    continue
         
         # Solve min cost flow
         try:
@@ -57,51 +86,47 @@ class ResourceAllocator:
         """
         Use linear programming for optimal resource allocation
         """
-        # Create LP problem
-        prob = LpProblem("Resource_Allocation", LpMaximize)
-        
-        # Decision variables: x[i][j] = amount of resources from center i to zone j
-        allocation_vars = {}
-        for i, rc in enumerate(self.relief_centers):
-            for j, dz in enumerate(self.disaster_zones):
-                allocation_vars[(i, j)] = LpVariable(f"x_{i}_{j}", lowBound=0)
-        
-        # Objective: Maximize coverage weighted by priority
-        objective = []
-        for i, rc in enumerate(self.relief_centers):
-            for j, dz in enumerate(self.disaster_zones):
-                try:
-                    distance = nx.shortest_path_length(self.road_network, rc.location.id, dz.location.id, weight='weight')
-                    priority_weight = dz.priority / (1 + distance)  # Higher priority, lower distance = better
-                    objective.append(priority_weight * allocation_vars[(i, j)])
-                except nx.NetworkXNoPath:
-                    continue
-        
-        prob += lpSum(objective)
-        
-        # Constraints
-        # Supply constraints: don't exceed relief center capacity
-        for i, rc in enumerate(self.relief_centers):
-            total_supply = sum(r.quantity for r in rc.resources)
-            prob += lpSum([allocation_vars[(i, j)] for j in range(len(self.disaster_zones))]) <= total_supply
-        
-        # Demand constraints: try to meet disaster zone needs
-        for j, dz in enumerate(self.disaster_zones):
-            total_demand = sum(r.quantity for r in dz.resources_needed)
-            prob += lpSum([allocation_vars[(i, j)] for i in range(len(self.relief_centers))]) <= total_demand
+        dists = self._center_distances()
         
-        # Solve
-        prob.solve()
+        # The LP is a transportation problem, so it is solved as a min cost flow:
+        # maximizing priority-weighted coverage = minimizing negated, integer-scaled weights
+        flow_network = nx.DiGraph()
+        total_supply = sum(sum(r.quantity for r in rc.resources) for rc in self.relief_centers)
+        flow_network.add_node("source", demand=-total_supply)
+        flow_network.add_node("sink", demand=total_supply)
+        flow_network.add_edge("source", "sink", weight=0)  # supply left undelivered
         
-        if LpStatus[prob.status] == "Optimal":
-            solution = {}
+        for rc in self.relief_centers:
+            flow_network.add_edge("source", f"rc_{rc.location.id}", capacity=sum(r.quantity for r in rc.resources), weight=0)
+        
+        priority_weights = {}
+        for j, dz in enumerate(self.disaster_zones):
+            total_demand = sum(r.quantity for r in dz.resources_needed)
+            flow_network.add_edge(f"dz_{dz.location.id}", "sink", capacity=total_demand, weight=0)
+            
             for i, rc in enumerate(self.relief_centers):
-                for j, dz in enumerate(self.disaster_zones):
-                    if value(allocation_vars[(i, j)]) > 0:
-                        solution[f"{rc.location.id}_to_{dz.location.id}"] = value(allocation_vars[(i, j)])
-            return {"status": "optimal", "allocation": solution, "objective_value": value(prob.objective)}
-        else:
+                if np.isfinite(dists[i, j]):
+                    priority_weight = dz.priority / (1 + dists[i, j])  # Higher priority, lower distance = better
+                    priority_weights[(i, j)] = priority_weight
+                    flow_network.add_edge(f"rc_{rc.location.id}", f"dz_{dz.location.id}",
+                                          capacity=min(flow_network["source"][f"rc_{rc.location.id}"]["capacity"], total_demand),
+                                          weight=-round(priority_weight * LP_WEIGHT_SCALE))
+        
+        try:
+            _, flow_dict = nx.network_simplex(flow_network)
+        except (nx.NetworkXUnfeasible, nx.NetworkXUnbounded):
             return {"status": "infeasible", "message": "No optimal solution found"}
+        
+        solution = {}
+        objective_value = 0.0
+        for (i, j), priority_weight in priority_weights.items():
+            rc_id = self.relief_centers[i].location.id
+            dz_id = self.disaster_zones[j].location.id
+            amount = flow_dict[f"rc_{rc_id}"][f"dz_{dz_id}"]
+            if amount > 0:
+                solution[f"{rc_id}_to_{dz_id}"] = amount
+                objective_value += priority_weight * amount
+        return {"status": "optimal", "allocation": solution, "objective_value": objective_value}
 
 class DynamicRouter:
     """Implements dynamic routing algorithms"""
@@ -109,29 +134,63 @@ class DynamicRouter:
     def __init__(self, road_network: nx.Graph):
         self.road_network = road_network
         self.traffic_conditions = {}
+        self.network_version = 0  # bump after mutating road_network to rebuild the CSR export
+        self._csr = None
+        self._csr_version = None
+        
+        # Per-edge attributes aligned with the CSR weights
+        self._edge_distance = None
+        self._edge_condition = None
+    
+    def _get_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, int]]:
+        """CSR (indptr, indices, weights, node_to_idx) export of the road network"""
+        if self._csr is None or self._csr_version != self.network_version:
+            indptr, indices, (weights, self._edge_distance), node_to_idx = build_csr_attributes(
+                self.road_network, ('weight', 'distance'))
+            self._csr = (indptr, indices, weights, node_to_idx)
+            self._edge_condition = np.ones(len(indices))
+            for road, condition_factor in self.traffic_conditions.items():
+                self._edge_condition[edge_slots(indptr, indices, node_to_idx, [road])] = condition_factor
+            self._csr_version = self.network_version
+        return self._csr
+    
+    def _csr_shortest_path(self, start: str, end: str, weights: np.ndarray) -> Tuple[List[str], float]:
+        """Dijkstra over the CSR export with the given per-edge weights; ([], inf) when unreachable"""
+        indptr, indices, _, node_to_idx = self._get_csr()
+        for node in (start, end):
+            if node not in node_to_idx:
+                raise nx.NodeNotFound(f"Node {node} not in graph")
+        
+        src, dst = node_to_idx[start], node_to_idx[end]
+        dist, pred = dijkstra_csr(indptr, indices, weights, src, dst, np.zeros(len(node_to_idx), dtype=np.bool_))
+        if not np.isfinite(dist[dst]):
+            return [], float('inf')
+        
+        node_ids = list(node_to_idx)
+        return [node_ids[i] for i in reconstruct_path(pred, src, dst)], float(dist[dst])
     
     def dijkstra_with_updates(self, start: str, end: str, blocked_roads: List[Tuple[str, str]] = None) -> Dict:
         """
         Dijkstra's algorithm with real-time road condition updates
         """
-        # Create a copy of the network
-        temp_network = self.road_network.copy()
+        indptr, indices, weights, node_to_idx = self._get_csr()
         
-        # Remove blocked roads
-        if blocked_roads:
-            for road in blocked_roads:
-                if temp_network.has_edge(road[0], road[1]):
-                    temp_network.remove_edge(road[0], road[1])
+        # Block roads by giving their CSR slots infinite weight instead of copying the network
+        blocked = list(blocked_roads or [])
+        if not self.road_network.is_directed():
+            blocked += [(v, u) for u, v in blocked]
+        if blocked:
+            weights = weights.copy()
+            weights[edge_slots(indptr, indices, node_to_idx, blocked)] = np.inf
         
-        try:
-            path = nx.shortest_path(temp_network, start, end, weight='weight')
-            distance = nx.shortest_path_length(temp_network, start, end, weight='weight')
+        path, distance = self._csr_shortest_path(start, end, weights)
+        if path:
             return {
                 "path": path,
                 "distance": distance,
                 "status": "success"
             }
-        except nx.NetworkXNoPath:
+        else:
             return {
                 "path": [],
                 "distance": float('inf'),
@@ -147,12 +206,14 @@ class DynamicRouter:
                 loc1 = locations_dict[node1]
                 loc2 = locations_dict[node2]
                 # Euclidean distance as heuristic
-                return np.sqrt((loc1['lat'] - loc2['lat'])**2 + (loc1['lng'] - loc2['lng'])**2)
+                return math.hypot(loc1['lat'] - loc2['lat'], loc1['lng'] - loc2['lng'])
             return 0
         
         try:
             path = nx.astar_path(self.road_network, start, end, heuristic=heuristic, weight='weight')
-            distance = nx.astar_path_length(self.road_network, start, end, heuristic=heuristic, weight='weight')
+            
+            # Sum the path's edge weights rather than running the search a second time
+            distance = sum(self.road_network[u][v].get('weight', 1) for u, v in zip(path, path[1:]))
             return {
                 "path": path,
                 "distance": distance,
@@ -171,27 +232,23 @@ class DynamicRouter:
         """
         Multi-objective routing considering time, distance, and road conditions
         """
-        # Modify edge weights based on multiple objectives
-        temp_network = self.road_network.copy()
-        
-        for u, v, data in temp_network.edges(data=True):
-            # Combine objectives: time, distance, road condition
-            time_weight = data.get('weight', 1) * objectives.get('time', 1)
-            distance_weight = data.get('distance', 1) * objectives.get('distance', 0.5)
-            condition_weight = self.traffic_conditions.get((u, v), 1) * objectives.get('condition', 0.3)
-            
-            temp_network[u][v]['combined_weight'] = time_weight + distance_weight + condition_weight
+        _, _, weights, _ = self._get_csr()
         
-        try:
-            path = nx.shortest_path(temp_network, start, end, weight='combined_weight')
-            total_weight = nx.shortest_path_length(temp_network, start, end, weight='combined_weight')
+        # Combine objectives: time, distance, road condition, for every edge in one vector expression
+        time_weight = weights * objectives.get('time', 1)
+        distance_weight = self._edge_distance * objectives.get('distance', 0.5)
+        condition_weight = self._edge_condition * objectives.get('condition', 0.3)
+        combined_weight = time_weight + distance_weight + condition_weight
+        
+        path, total_weight = self._csr_shortest_path(start, end, combined_weight)
+        if path:
             return {
                 "path": path,
                 "total_weight": total_weight,
                 "objectives_used": objectives,
                 "status": "success"
             }
-        except nx.NetworkXNoPath:
+        else:
             return {
                 "path": [],
                 "total_weight": float('inf'),
@@ -204,48 +261,55 @@ class DynamicRouter:
         self.traffic_conditions[road] = condition_factor
         # Also update reverse direction
         self.traffic_conditions[(road[1], road[0])] = condition_factor
+        
+        # Keep the CSR condition factors in step when the export is current
+        if self._csr is not None and self._csr_version == self.network_version:
+            indptr, indices, _, node_to_idx = self._csr
+            self._edge_condition[edge_slots(indptr, indices, node_to_idx, [road, (road[1], road[0])])] = condition_factor
 
 class DemandPredictor:
     """ML-based demand prediction (simplified implementation)"""
     
     def __init__(self):
         self.historical_data = []
+        self._rng = np.random.default_rng()
     
     def predict_demand_hotspots(self, current_conditions: Dict) -> List[Dict]:
         """
         Predict demand hotspots using simplified ML approach
         """
         # Simplified prediction based on severity and population
-        hotspots = []
+        zones = current_conditions.get('disaster_zones', [])
+        severity = np.fromiter((z.get('severity', 1) for z in zones), dtype=np.float64, count=len(zones))
+        population = np.fromiter((z.get('population_affected', 0) for z in zones), dtype=np.float64, count=len(zones))
         
-        for zone_data in current_conditions.get('disaster_zones', []):
-            severity = zone_data.get('severity', 1)
-            population = zone_data.get('population_affected', 0)
-            
-            # Simple scoring algorithm (replace with actual ML model)
-            demand_score = (severity * 0.6 + (population / 1000) * 0.4) * np.random.uniform(0.8, 1.2)
-            
-            if demand_score > 5:  # Threshold for high demand
-                hotspots.append({
-                    'zone_id': zone_data.get('id'),
-                    'predicted_demand_score': demand_score,
-                    'recommended_resources': self._calculate_resource_needs(severity, population),
-                    'urgency_level': 'high' if demand_score > 7 else 'medium'
-                })
+        # Simple scoring algorithm (replace with actual ML model)
+        demand_scores = (severity * 0.6 + (population / 1000) * 0.4) * self._rng.uniform(0.8, 1.2, len(zones))
+        
+        hot = np.flatnonzero(demand_scores > 5)  # Threshold for high demand
+        resource_needs = self._calculate_resource_needs(severity[hot], population[hot])
+        
+        hotspots = [{
+            'zone_id': zones[i].get('id'),
+            'predicted_demand_score': float(demand_scores[i]),
+            'recommended_resources': needs,
+            'urgency_level': 'high' if demand_scores[i] > 7 else 'medium'
+        } for i, needs in zip(hot, resource_needs)]
         
         return sorted(hotspots, key=lambda x: x['predicted_demand_score'], reverse=True)
     
-    def _calculate_resource_needs(self, severity: int, population: int) -> Dict:
-        """Calculate estimated resource needs based on severity and population"""
-        base_food_ratio = 0.3  # 30% of population needs food aid
-        base_water_ratio = 0.5  # 50% needs water
-        base_medical_ratio = 0.1  # 10% needs medical aid
+    def _calculate_resource_needs(self, severity: np.ndarray, population: np.ndarray) -> List[Dict]:
+        """Calculate estimated resource needs for each zone based on severity and population"""
+        # Share of the population needing food, water, medical aid and blankets
+        base_ratios = np.array([0.3, 0.5, 0.1, 0.2])
+        per_item = np.array([1, 3, 1, 1])  # 3 water bottles per person
         
         severity_multiplier = severity / 10
         
-        return {
-            'food_packages': int(population * base_food_ratio * severity_multiplier),
-            'water_bottles': int(population * base_water_ratio * severity_multiplier * 3),  # 3 bottles per person
-            'medical_kits': int(population * base_medical_ratio * severity_multiplier),
-            'blankets': int(population * 0.2 * severity_multiplier)  # 20% need blankets
-        }
+        needs = (population[:, None] * base_ratios * severity_multiplier[:, None] * per_item).astype(np.int64)
+        return [{
+            'food_packages': food,
+            'water_bottles': water,
+            'medical_kits': medical,
+            'blankets': blankets
+        } for food, water, medical, blankets in needs.tolist()]
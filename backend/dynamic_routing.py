@@ -4,16 +4,19 @@ Real-time route optimization with adaptive algorithms
 """
 import networkx as nx
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, Deque
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 import heapq
 import asyncio
 import json
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import islice
 import threading
 import time
+from _csr import (build_csr, transpose_csr, astar_csr, bidirectional_dijkstra_csr, bidirectional_path,
+                  reconstruct_path)
 
 class RoadCondition(Enum):
     EXCELLENT = 1.0
@@ -29,6 +32,12 @@ class TrafficLevel(Enum):
     HEAVY = 1.8
     SEVERE = 2.5
 
+# Multiplier lookup tables indexed by each enum's declaration order
+_ROAD_INDEX = {condition: i for i, condition in enumerate(RoadCondition)}
+_TRAFFIC_INDEX = {traffic: i for i, traffic in enumerate(TrafficLevel)}
+_ROAD_MULT = np.array([condition.value for condition in RoadCondition])
+_TRAFFIC_MULT = np.array([traffic.value for traffic in TrafficLevel])
+
 @dataclass
 class RouteSegment:
     from_node: str
@@ -38,11 +47,19 @@ class RouteSegment:
     road_condition: RoadCondition = RoadCondition.GOOD
     traffic_level: TrafficLevel = TrafficLevel.LIGHT
     last_updated: datetime = field(default_factory=datetime.now)
+    # Derived from the fields above; call refresh_conditions() after changing condition or traffic
+    effective_time: float = field(init=False)
+    road_condition_idx: int = field(init=False)  # row in _ROAD_MULT
+    traffic_level_idx: int = field(init=False)  # row in _TRAFFIC_MULT
     
-    @property
-    def effective_time(self) -> float:
-        """Calculate effective travel time considering conditions"""
-        return self.base_time * self.road_condition.value * self.traffic_level.value
+    def __post_init__(self):
+        self.refresh_conditions()
+    
+    def refresh_conditions(self):
+        """Calculate effective travel time and lookup-table indices considering conditions"""
+        self.road_condition_idx = _ROAD_INDEX[self.road_condition]
+        self.traffic_level_idx = _TRAFFIC_INDEX[self.traffic_level]
+        self.effective_time = self.base_time * self.road_condition.value * self.traffic_level.value
     
     @property
     def is_passable(self) -> bool:
@@ -75,62 +92,168 @@ class DynamicRoutingEngine:
         self.road_network = nx.DiGraph()
         self.route_segments: Dict[Tuple[str, str], RouteSegment] = {}
         self.active_routes: Dict[str, DynamicRoute] = {}
-        self.traffic_history: Dict[Tuple[str, str], List[Tuple[datetime, TrafficLevel]]] = defaultdict(list)
-        self.condition_history: Dict[Tuple[str, str], List[Tuple[datetime, RoadCondition]]] = defaultdict(list)
-        self.route_cache: Dict[Tuple[str, str], List[str]] = {}
-        self.cache_expiry: Dict[Tuple[str, str], datetime] = {}
-        self.update_lock = threading.Lock()
+        # Histories keep only the most recent updates per segment so long simulations stay bounded
+        self.traffic_history: Dict[Tuple[str, str], Deque[Tuple[datetime, TrafficLevel]]] = defaultdict(lambda: deque(maxlen=256))
+        self.condition_history: Dict[Tuple[str, str], Deque[Tuple[datetime, RoadCondition]]] = defaultdict(lambda: deque(maxlen=256))
+        # Keyed by (origin, destination, avoided nodes); values are node-index paths
+        self.route_cache: Dict[Tuple[str, str, frozenset], List[int]] = {}
+        self.cache_expiry: Dict[Tuple[str, str, frozenset], datetime] = {}
+        # Reverse index from a segment to the cache keys whose path uses it
+        self._edge_to_cache_keys: Dict[Tuple[str, str], Set[Tuple[str, str, frozenset]]] = defaultdict(set)
+        # Reverse index from a segment to the active routes that use it
+        self._segment_to_routes: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        # Yen's k-shortest paths per (origin, destination) as (weights version, node-index paths, exhausted);
+        # any weight change can reorder them, so entries are only valid for the version they were computed at
+        self._alternative_paths: Dict[Tuple[str, str], Tuple[int, List[List[int]], bool]] = {}
+        self._weights_version = 0
+        # Updates on different shards can race, so the version is only ever advanced under its own lock
+        self._version_lock = threading.Lock()
+        # Shard locks only serialize updates to the same segment; the state every update shares has its own
+        # lock: _network_lock for the graph and CSR, _cache_lock for the route caches, active routes and
+        # their reverse indexes, and _version_lock for the weights version
+        self._locks = [threading.Lock() for _ in range(64)]
+        self._cache_lock = threading.Lock()
+        
+        # Node ids and coordinates packed by integer index for the A* heuristic and CSR searches;
+        # string ids are translated at the public API boundary and routing works on the indices
+        self._node_idx: Dict[str, int] = {}
+        self._node_ids: List[str] = []
+        self._lat = np.empty(0)
+        self._lng = np.empty(0)
+        self._segment_by_edge: Dict[int, RouteSegment] = {}  # keyed by _edge_key(from_idx, to_idx)
+        # (CSR, reversed CSR, edge slots, reverse slots), rebuilt lazily after graph changes and published
+        # as one tuple so searches and in-place weight updates never see arrays and slot maps from different builds.
+        # Edge slots map _edge_key(from_idx, to_idx) to a CSR slot; reverse slots map it on to the reversed CSR.
+        self._csr_state: Optional[Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray],
+                                        Tuple[np.ndarray, np.ndarray, np.ndarray],
+                                        Dict[int, int], np.ndarray]] = None
+        # Guards road_network edge writes and the CSR build, so no weight change is lost between them
+        self._network_lock = threading.Lock()
         
     def initialize_network(self, locations: List[Dict], connections: List[Dict]):
         """Initialize the road network with locations and connections"""
-        # Add nodes
-        for location in locations:
-            self.road_network.add_node(
-                location['id'],
-                lat=location['lat'],
-                lng=location['lng'],
-                type=location['type'],
-                name=location.get('name', '')
-            )
-        
-        # Add edges with route segments
-        for connection in connections:
-            from_id = connection['from']
-            to_id = connection['to']
-            distance = connection['distance']
-            base_time = connection.get('time', distance / 50)  # Default 50 km/h
+        with self._network_lock:
+            # Add nodes
+            for location in locations:
+                self.road_network.add_node(
+                    location['id'],
+                    lat=location['lat'],
+                    lng=location['lng'],
+                    type=location['type'],
+                    name=location.get('name', '')
+                )
+        
+            # Add edges with route segments
+            for connection in connections:
+                from_id = connection['from']
+                to_id = connection['to']
+                distance = connection['distance']
+                base_time = connection.get('time', distance / 50)  # Default 50 km/h
             
-            segment = RouteSegment(
-                from_node=from_id,
-                to_node=to_id,
-                base_distance=distance,
-                base_time=base_time
-            )
+                segment = RouteSegment(
+                    from_node=from_id,
+                    to_node=to_id,
+                    base_distance=distance,
+                    base_time=base_time
+                )
             
-            self.route_segments[(from_id, to_id)] = segment
-            self.road_network.add_edge(
-                from_id, to_id,
-                weight=segment.effective_time,
-                distance=distance,
-                segment=segment
-            )
+                self.route_segments[(from_id, to_id)] = segment
+                self.road_network.add_edge(
+                    from_id, to_id,
+                    weight=segment.effective_time,
+                    distance=distance,
+                    segment=segment
+                )
+        
+            self._index_nodes()
+            self._csr_state = None
+        self._bump_weights_version()
+    
+    def _index_nodes(self):
+        """Assign every node a contiguous index and pack coordinates and segments by it
+        
+        Nodes keep their index as the network grows, since new nodes are appended.
+        Coordinates are NaN for nodes added without a location.
+        """
+        nodes = list(self.road_network.nodes(data=True))
+        self._node_ids = [node for node, _ in nodes]
+        self._node_idx = {node: i for i, node in enumerate(self._node_ids)}
+        self._lat = np.array([data.get('lat', np.nan) for _, data in nodes], dtype=np.float64)
+        self._lng = np.array([data.get('lng', np.nan) for _, data in nodes], dtype=np.float64)
+        self._segment_by_edge = {
+            self._edge_key(self._node_idx[u], self._node_idx[v]): segment
+            for (u, v), segment in self.route_segments.items()
+        }
+    
+    def _edge_key(self, from_idx: int, to_idx: int) -> int:
+        """Pack a pair of node indices into a single integer key"""
+        return from_idx * len(self._node_ids) + to_idx
+    
+    def _get_csr(self) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """CSR (indptr, indices, weights) export of the road network in self._node_idx order, and its reverse"""
+        state = self._csr_state
+        if state is None:
+            with self._network_lock:
+                state = self._csr_state
+                if state is None:
+                    indptr, indices, weights, _ = build_csr(self.road_network, nodelist=self._node_ids)
+                    rindptr, rindices, rweights, order = transpose_csr(indptr, indices, weights)
+                    
+                    # Slot maps let condition updates write edge weights in place instead of rebuilding
+                    sources = np.repeat(np.arange(len(self._node_ids), dtype=np.int64), np.diff(indptr))
+                    edge_slot = dict(zip((sources * len(self._node_ids) + indices).tolist(), range(len(indices))))
+                    reverse_slot = np.empty_like(order)
+                    reverse_slot[order] = np.arange(len(order))
+                    state = self._csr_state = ((indptr, indices, weights), (rindptr, rindices, rweights),
+                                               edge_slot, reverse_slot)
+        return state[0], state[1]
+    
+    def _set_edge_weight(self, from_node: str, to_node: str, weight: float):
+        """Store a new weight on an existing edge of the road network and in its CSR arrays
+        
+        inf removes the edge from the graph and hides it from CSR searches.
+        """
+        with self._network_lock:
+            if not self.road_network.has_edge(from_node, to_node):
+                return
+            if weight == float('inf'):
+                self.road_network.remove_edge(from_node, to_node)
+            else:
+                self.road_network[from_node][to_node]['weight'] = weight
+            
+            state = self._csr_state
+            if state is None:
+                return  # the next _get_csr() exports the current graph weights
+            csr, reverse_csr, edge_slot, reverse_slot = state
+            slot = edge_slot.get(self._edge_key(self._node_idx[from_node], self._node_idx[to_node]))
+            if slot is not None:
+                csr[2][slot] = weight
+                reverse_csr[2][reverse_slot[slot]] = weight
+    
+    def _bump_weights_version(self):
+        """Mark every cached alternative route stale; call after the new weights are written"""
+        with self._version_lock:
+            self._weights_version += 1
+    
+    def _segment_lock(self, segment_key: Tuple[str, str]) -> threading.Lock:
+        """Lock shard guarding updates to one segment"""
+        return self._locks[hash(segment_key) & 63]
     
     def update_road_condition(self, from_node: str, to_node: str, condition: RoadCondition):
         """Update road condition for a specific segment"""
-        with self.update_lock:
-            segment_key = (from_node, to_node)
+        segment_key = (from_node, to_node)
+        with self._segment_lock(segment_key):
             if segment_key in self.route_segments:
                 segment = self.route_segments[segment_key]
                 old_condition = segment.road_condition
                 segment.road_condition = condition
+                segment.refresh_conditions()
                 segment.last_updated = datetime.now()
                 
                 # Update network edge weight
-                if self.road_network.has_edge(from_node, to_node):
-                    if condition == RoadCondition.BLOCKED:
-                        self.road_network.remove_edge(from_node, to_node)
-                    else:
-                        self.road_network[from_node][to_node]['weight'] = segment.effective_time
+                self._set_edge_weight(from_node, to_node, segment.effective_time)
+                # Bumped even when the edge is already gone, e.g. a segment reopened after BLOCKED
+                self._bump_weights_version()
                 
                 # Record in history
                 self.condition_history[segment_key].append((datetime.now(), condition))
@@ -145,17 +268,18 @@ class DynamicRoutingEngine:
     
     def update_traffic_level(self, from_node: str, to_node: str, traffic: TrafficLevel):
         """Update traffic level for a specific segment"""
-        with self.update_lock:
-            segment_key = (from_node, to_node)
+        segment_key = (from_node, to_node)
+        with self._segment_lock(segment_key):
             if segment_key in self.route_segments:
                 segment = self.route_segments[segment_key]
                 old_traffic = segment.traffic_level
                 segment.traffic_level = traffic
+                segment.refresh_conditions()
                 segment.last_updated = datetime.now()
                 
                 # Update network edge weight
-                if self.road_network.has_edge(from_node, to_node):
-                    self.road_network[from_node][to_node]['weight'] = segment.effective_time
+                self._set_edge_weight(from_node, to_node, segment.effective_time)
+                self._bump_weights_version()
                 
                 # Record in history
                 self.traffic_history[segment_key].append((datetime.now(), traffic))
@@ -171,43 +295,26 @@ class DynamicRoutingEngine:
         avoid_nodes = avoid_nodes or set()
         
         # Check cache first
-        cache_key = (origin, destination)
-        if (cache_key in self.route_cache and 
-            cache_key in self.cache_expiry and 
-            datetime.now() < self.cache_expiry[cache_key]):
-            waypoints = self.route_cache[cache_key]
-        else:
+        cache_key = (origin, destination, frozenset(avoid_nodes))
+        path = self._get_cached_route(cache_key)
+        if path is None:
             # Calculate new route
-            waypoints = self._calculate_route(origin, destination, avoid_nodes, priority)
-            if not waypoints:
+            path = self._calculate_route(origin, destination, avoid_nodes, priority)
+            if not path:
                 return None
             
             # Cache the result
-            self.route_cache[cache_key] = waypoints
-            self.cache_expiry[cache_key] = datetime.now() + timedelta(minutes=5)
+            self._cache_route(cache_key, path)
         
         # Build route segments
-        segments = []
-        total_distance = 0
-        estimated_time = 0
-        
-        for i in range(len(waypoints) - 1):
-            from_node = waypoints[i]
-            to_node = waypoints[i + 1]
-            
-            segment_key = (from_node, to_node)
-            if segment_key in self.route_segments:
-                segment = self.route_segments[segment_key]
-                segments.append(segment)
-                total_distance += segment.base_distance
-                estimated_time += segment.effective_time
+        segments, total_distance, estimated_time = self._build_segments(path)
         
         # Create dynamic route
         route = DynamicRoute(
             route_id=f"route_{origin}_{destination}_{int(time.time())}",
             origin=origin,
             destination=destination,
-            waypoints=waypoints,
+            waypoints=[self._node_ids[i] for i in path],
             segments=segments,
             total_distance=total_distance,
             estimated_time=estimated_time,
@@ -215,138 +322,157 @@ class DynamicRoutingEngine:
         )
         
         # Store active route
-        self.active_routes[route.route_id] = route
+        self._store_active_route(route)
         
         return route
     
-    def _calculate_route(self, origin: str, destination: str, avoid_nodes: Set[str], priority: int) -> List[str]:
+    def _calculate_route(self, origin: str, destination: str, avoid_nodes: Set[str], priority: int) -> List[int]:
         """Calculate route using appropriate algorithm based on priority"""
         if priority >= 4:  # High priority - use A* with heuristic
             return self._astar_route(origin, destination, avoid_nodes)
         else:  # Normal priority - use Dijkstra
             return self._dijkstra_route(origin, destination, avoid_nodes)
     
-    def _astar_route(self, origin: str, destination: str, avoid_nodes: Set[str]) -> List[str]:
+    def _astar_route(self, origin: str, destination: str, avoid_nodes: Set[str]) -> List[int]:
         """A* algorithm with geographic heuristic"""
-        def heuristic(node1: str, node2: str) -> float:
-            if node1 not in self.road_network.nodes or node2 not in self.road_network.nodes:
-                return 0
-            
-            n1_data = self.road_network.nodes[node1]
-            n2_data = self.road_network.nodes[node2]
-            
-            # Euclidean distance as heuristic
-            lat_diff = n1_data['lat'] - n2_data['lat']
-            lng_diff = n1_data['lng'] - n2_data['lng']
-            return np.sqrt(lat_diff**2 + lng_diff**2) * 111  # Rough km conversion
-        
-        try:
-            # Create temporary graph without avoided nodes
-            temp_graph = self.road_network.copy()
-            for node in avoid_nodes:
-                if node in temp_graph:
-                    temp_graph.remove_node(node)
-            
-            path = nx.astar_path(temp_graph, origin, destination, 
-                               heuristic=heuristic, weight='weight')
-            return path
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
-            return []
+        # Euclidean distance over the packed coordinates, scaled by 111 as a rough km conversion
+        return self._csr_route(origin, destination, avoid_nodes, use_astar=True)
     
-    def _dijkstra_route(self, origin: str, destination: str, avoid_nodes: Set[str]) -> List[str]:
+    def _dijkstra_route(self, origin: str, destination: str, avoid_nodes: Set[str]) -> List[int]:
         """Dijkstra's algorithm for shortest path"""
-        try:
-            # Create temporary graph without avoided nodes
-            temp_graph = self.road_network.copy()
-            for node in avoid_nodes:
-                if node in temp_graph:
-                    temp_graph.remove_node(node)
-            
-            path = nx.shortest_path(temp_graph, origin, destination, weight='weight')
-            return path
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
+        return self._csr_route(origin, destination, avoid_nodes, use_astar=False)
+    
+    def _csr_route(self, origin: str, destination: str, avoid_nodes: Set[str], use_astar: bool) -> List[int]:
+        """Node-index path from the compiled A* or Dijkstra kernel, with avoided nodes masked out"""
+        if (origin not in self._node_idx or destination not in self._node_idx or
+                origin in avoid_nodes or destination in avoid_nodes):
             return []
+        
+        (indptr, indices, weights), reverse_csr = self._get_csr()
+        blocked_mask = np.zeros(len(self._node_ids), dtype=np.bool_)
+        blocked_mask[[self._node_idx[node] for node in avoid_nodes if node in self._node_idx]] = True
+        
+        src, dst = self._node_idx[origin], self._node_idx[destination]
+        if use_astar:
+            pred = astar_csr(indptr, indices, weights, src, dst, blocked_mask, self._lat, self._lng, 111.0)
+            return reconstruct_path(pred, src, dst)
+        
+        # Searching from both ends settles far fewer nodes than one search on long routes
+        _, meet, pred, succ = bidirectional_dijkstra_csr(indptr, indices, weights, *reverse_csr,
+                                                         src, dst, blocked_mask)
+        return bidirectional_path(pred, succ, src, dst, meet)
     
     def find_alternative_routes(self, origin: str, destination: str, num_alternatives: int = 3) -> List[DynamicRoute]:
         """Find multiple alternative routes"""
+        paths = self._k_shortest_paths(origin, destination, num_alternatives)
+        
         alternatives = []
-        avoid_edges = set()
-        
-        for i in range(num_alternatives):
-            # Create temporary graph without avoided edges
-            temp_graph = self.road_network.copy()
-            for edge in avoid_edges:
-                if temp_graph.has_edge(edge[0], edge[1]):
-                    temp_graph.remove_edge(edge[0], edge[1])
-            
-            try:
-                path = nx.shortest_path(temp_graph, origin, destination, weight='weight')
-                
-                # Create route
-                route = self._create_route_from_path(path, f"alt_{i}")
-                if route:
-                    alternatives.append(route)
-                    
-                    # Add edges from this path to avoid list for next iteration
-                    for j in range(len(path) - 1):
-                        avoid_edges.add((path[j], path[j + 1]))
-                
-            except (nx.NetworkXNoPath, nx.NodeNotFound):
-                break
+        for i, path in enumerate(paths):
+            route = self._create_route_from_path(path, f"alt_{i}")
+            if route:
+                alternatives.append(route)
         
         return alternatives
     
-    def _create_route_from_path(self, path: List[str], route_suffix: str) -> Optional[DynamicRoute]:
-        """Create DynamicRoute from path"""
-        if len(path) < 2:
-            return None
+    def _k_shortest_paths(self, origin: str, destination: str, k: int) -> List[List[int]]:
+        """Up to k node-index paths in order of increasing travel time, reused until an edge weight changes"""
+        version = self._weights_version
+        with self._cache_lock:
+            cached = self._alternative_paths.get((origin, destination))
+        if cached is not None and cached[0] == version and (cached[2] or len(cached[1]) >= k):
+            return cached[1][:k]
         
+        # Yen's algorithm yields distinct simple paths in order of increasing travel time
+        try:
+            with self._network_lock:
+                paths = [[self._node_idx[node] for node in waypoints]
+                         for waypoints in islice(nx.shortest_simple_paths(self.road_network, origin, destination, weight='weight'), k)]
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
+            return []
+        
+        with self._cache_lock:
+            self._alternative_paths[(origin, destination)] = (version, paths, len(paths) < k)
+        return paths
+    
+    def _build_segments(self, path: List[int]) -> Tuple[List[RouteSegment], float, float]:
+        """Segments of a node-index path with their total distance and estimated time"""
         segments = []
         total_distance = 0
         estimated_time = 0
         
         for i in range(len(path) - 1):
-            segment_key = (path[i], path[i + 1])
-            if segment_key in self.route_segments:
-                segment = self.route_segments[segment_key]
+            segment = self._segment_by_edge.get(self._edge_key(path[i], path[i + 1]))
+            if segment is not None:
                 segments.append(segment)
                 total_distance += segment.base_distance
                 estimated_time += segment.effective_time
         
+        return segments, total_distance, estimated_time
+    
+    def _create_route_from_path(self, path: List[int], route_suffix: str) -> Optional[DynamicRoute]:
+        """Create DynamicRoute from a node-index path"""
+        if len(path) < 2:
+            return None
+        
+        segments, total_distance, estimated_time = self._build_segments(path)
+        waypoints = [self._node_ids[i] for i in path]
+        
         return DynamicRoute(
-            route_id=f"route_{path[0]}_{path[-1]}_{route_suffix}_{int(time.time())}",
-            origin=path[0],
-            destination=path[-1],
-            waypoints=path,
+            route_id=f"route_{waypoints[0]}_{waypoints[-1]}_{route_suffix}_{int(time.time())}",
+            origin=waypoints[0],
+            destination=waypoints[-1],
+            waypoints=waypoints,
             segments=segments,
             total_distance=total_distance,
             estimated_time=estimated_time,
             priority=3
         )
     
+    def _get_cached_route(self, cache_key: Tuple[str, str, frozenset]) -> Optional[List[int]]:
+        """Return the cached node-index path for a query, or None when missing or expired"""
+        with self._cache_lock:
+            if (cache_key in self.route_cache and 
+                cache_key in self.cache_expiry and 
+                datetime.now() < self.cache_expiry[cache_key]):
+                return self.route_cache[cache_key]
+        return None
+    
+    def _cache_route(self, cache_key: Tuple[str, str, frozenset], path: List[int]):
+        """Cache a node-index path for a query for five minutes"""
+        with self._cache_lock:
+            self.route_cache[cache_key] = path
+            self.cache_expiry[cache_key] = datetime.now() + timedelta(minutes=5)
+            
+            for i in range(len(path) - 1):
+                self._edge_to_cache_keys[(self._node_ids[path[i]], self._node_ids[path[i + 1]])].add(cache_key)
+    
     def _invalidate_cache_for_segment(self, from_node: str, to_node: str):
         """Invalidate route cache entries that use the affected segment"""
-        to_remove = []
-        for cache_key in self.route_cache:
-            path = self.route_cache[cache_key]
-            for i in range(len(path) - 1):
-                if path[i] == from_node and path[i + 1] == to_node:
-                    to_remove.append(cache_key)
-                    break
-        
-        for key in to_remove:
-            del self.route_cache[key]
-            if key in self.cache_expiry:
-                del self.cache_expiry[key]
+        # Keys left behind under other segments are harmless: popping them again is a no-op
+        with self._cache_lock:
+            for key in self._edge_to_cache_keys.pop((from_node, to_node), ()):
+                self.route_cache.pop(key, None)
+                self.cache_expiry.pop(key, None)
+    
+    def _store_active_route(self, route: DynamicRoute):
+        """Track a route as active and index it under each of its segments"""
+        with self._cache_lock:
+            replaced = self.active_routes.get(route.route_id)
+            if replaced is not None:
+                for segment in replaced.segments:
+                    self._segment_to_routes[(segment.from_node, segment.to_node)].discard(route.route_id)
+            
+            self.active_routes[route.route_id] = route
+            for segment in route.segments:
+                self._segment_to_routes[(segment.from_node, segment.to_node)].add(route.route_id)
     
     def _recalculate_affected_routes(self, from_node: str, to_node: str):
         """Recalculate active routes that use the affected segment"""
-        for route in self.active_routes.values():
-            for segment in route.segments:
-                if segment.from_node == from_node and segment.to_node == to_node:
-                    route.recalculate_metrics()
-                    print(f"[Dynamic Routing] Recalculated route {route.route_id}: {route.estimated_time:.2f}h")
-                    break
+        with self._cache_lock:
+            routes = [self.active_routes[route_id] for route_id in self._segment_to_routes.get((from_node, to_node), ())]
+        for route in routes:
+            route.recalculate_metrics()
+            print(f"[Dynamic Routing] Recalculated route {route.route_id}: {route.estimated_time:.2f}h")
     
     def get_route_status(self, route_id: str) -> Optional[Dict]:
         """Get current status of a route"""
@@ -358,8 +484,11 @@ class DynamicRoutingEngine:
         # Check for any blocked segments
         blocked_segments = [seg for seg in route.segments if not seg.is_passable]
         
-        # Calculate delay factors
-        delay_factor = sum(seg.traffic_level.value * seg.road_condition.value for seg in route.segments) / len(route.segments)
+        # Calculate delay factors from the multiplier tables in one vector pass
+        road_idx = np.fromiter((seg.road_condition_idx for seg in route.segments), dtype=np.int8, count=len(route.segments))
+        traffic_idx = np.fromiter((seg.traffic_level_idx for seg in route.segments), dtype=np.int8, count=len(route.segments))
+        # A route with no segments (origin == destination) has no delay
+        delay_factor = float((_TRAFFIC_MULT[traffic_idx] * _ROAD_MULT[road_idx]).mean()) if route.segments else 1.0
         
         return {
             'route_id': route_id,
@@ -1,14 +1,21 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import networkx as nx
 import numpy as np
+from scipy.sparse.csgraph import dijkstra
 from datetime import datetime
 import json
+import math
+import orjson
+import uuid
+from _distance import haversine, haversine_distances
 from dynamic_routing import routing_engine, RoadCondition, TrafficLevel, DynamicRoute
 
-app = FastAPI(title="DisasterOps API", description="Real-Time Relief Resource Allocation System")
+app = FastAPI(title="DisasterOps API", description="Real-Time Relief Resource Allocation System",
+              default_response_class=ORJSONResponse)
 
 # CORS middleware for React frontend
 app.add_middleware(
@@ -64,9 +71,138 @@ relief_centers: List[ReliefCenter] = []
 disaster_zones: List[DisasterZone] = []
 road_network = nx.Graph()
 
+# Id lookups kept in step with the lists above; the first entry registered under an id wins
+locations_by_id: Dict[str, Location] = {}
+resources_by_center: Dict[str, Dict[str, Resource]] = {}  # center id -> resource id -> Resource
+# Stock levels as a matrix for vectorized eligibility checks: center_quantities[position in relief_centers,
+# resource_columns[resource id]], with -1 where a center does not stock the resource at all
+resource_columns: Dict[str, int] = {}
+center_quantities = np.empty((0, 0), dtype=np.int64)
+_rad_cache: Dict[str, Tuple[float, float, float]] = {}  # location id -> (lat radians, lng radians, cos lat)
+
+def _index_location(location: Location):
+    if location.id not in locations_by_id:
+        locations_by_id[location.id] = location
+        lat_rad, lng_rad = math.radians(location.lat), math.radians(location.lng)
+        _rad_cache[location.id] = (lat_rad, lng_rad, math.cos(lat_rad))
+
+def _index_relief_center(center: ReliefCenter):
+    _index_location(center.location)
+    center_resources = resources_by_center.setdefault(center.location.id, {})
+    for resource in center.resources:
+        center_resources.setdefault(resource.id, resource)
+        resource_columns.setdefault(resource.id, len(resource_columns))
+
+def _build_center_quantities():
+    """Fill center_quantities from the indexed Resource models, which stay in step as the serialized view"""
+    global center_quantities
+    center_quantities = np.full((len(relief_centers), len(resource_columns)), -1, dtype=np.int64)
+    for i, rc in enumerate(relief_centers):
+        for resource_id, resource in resources_by_center[rc.location.id].items():
+            center_quantities[i, resource_columns[resource_id]] = resource.quantity
+
+def _index_disaster_zone(zone: DisasterZone):
+    _index_location(zone.location)
+
+# All-pairs shortest paths over road_network, recomputed lazily after the network changes.
+# Matrices are indexed by node_index; dist is np.inf for unreachable pairs. The CSR export is kept
+# between runs: closures and restores rewrite its weights in place, and only new locations or roads
+# (adjacency reset to None) force a fresh export.
+_apsp_cache = {"node_ids": [], "node_index": {}, "adjacency": None, "edge_slots": {},
+               "dist": None, "predecessors": None, "dirty": True}
+
+def _ensure_apsp():
+    """Run SciPy's compiled Dijkstra from every location over a CSR export of the road network"""
+    if _apsp_cache["adjacency"] is None:
+        node_ids = list(road_network.nodes)
+        adjacency = nx.to_scipy_sparse_array(road_network, nodelist=node_ids, weight='weight', format='csr')
+        rows = np.repeat(np.arange(len(node_ids)), np.diff(adjacency.indptr))
+        edge_slots = {edge: slot for slot, edge in enumerate(zip(rows.tolist(), adjacency.indices.tolist()))}
+        _apsp_cache.update(node_ids=node_ids, node_index={node: i for i, node in enumerate(node_ids)},
+                           adjacency=adjacency, edge_slots=edge_slots, dirty=True)
+    if _apsp_cache["dirty"]:
+        dist, predecessors = dijkstra(_apsp_cache["adjacency"], directed=False, return_predecessors=True)
+        _apsp_cache.update(dist=dist, predecessors=predecessors, dirty=False)
+    return _apsp_cache
+
+def _set_road_weight(from_id: str, to_id: str, weight: float):
+    """Write a road's weight into the cached CSR export (np.inf closes it) and mark distances stale"""
+    adjacency = _apsp_cache["adjacency"]
+    i = _apsp_cache["node_index"].get(from_id)
+    j = _apsp_cache["node_index"].get(to_id)
+    slots = [_apsp_cache["edge_slots"].get((i, j)), _apsp_cache["edge_slots"].get((j, i))]
+    if adjacency is not None and None not in slots:
+        adjacency.data[slots] = weight
+    else:
+        _apsp_cache["adjacency"] = None  # the road was never exported; export the network again
+    _apsp_cache["dirty"] = True
+
+def _path_length(from_id: str, to_id: str) -> float:
+    """Shortest path length between two locations from the all-pairs cache; inf when there is no path"""
+    apsp = _ensure_apsp()
+    src = apsp["node_index"].get(from_id)
+    dst = apsp["node_index"].get(to_id)
+    if src is None or dst is None:
+        return float('inf')
+    return float(apsp["dist"][src, dst])
+
+def _haversine_heuristic(from_id: str, to_id: str) -> float:
+    """Straight-line travel time at 50 km/h, a lower bound on any road between the two locations"""
+    return calculate_distance(from_id, to_id) / 50
+
+def _shortest_path(from_id: str, to_id: str) -> Optional[Tuple[float, List[str]]]:
+    """(length, path) between two locations, or None when there is no path
+    
+    Served from the all-pairs cache while it is fresh. After the network changes a single A* query
+    is far cheaper than recomputing every pair, so the rebuild is left to batch callers.
+    """
+    if _apsp_cache["dirty"]:
+        try:
+            path = nx.astar_path(road_network, from_id, to_id, heuristic=_haversine_heuristic, weight='weight')
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
+            return None
+        return float(nx.path_weight(road_network, path, 'weight')), path
+    
+    apsp = _ensure_apsp()
+    src = apsp["node_index"].get(from_id)
+    dst = apsp["node_index"].get(to_id)
+    if src is None or dst is None or not np.isfinite(apsp["dist"][src, dst]):
+        return None
+    
+    # Walk the predecessor row back from the destination
+    path = [dst]
+    while path[-1] != src:
+        path.append(apsp["predecessors"][src, path[-1]])
+    return float(apsp["dist"][src, dst]), [apsp["node_ids"][i] for i in reversed(path)]
+
+# Bumped per cached GET endpoint by the requests that change its data, so its cached body knows when it is stale
+_CACHED_ENDPOINTS = ("relief-centers", "disaster-zones", "network-stats")
+state_versions: Dict[str, int] = dict.fromkeys(_CACHED_ENDPOINTS, 0)
+# Versions restart at 0 with the process, so ETags also carry a per-process id
+_BOOT_ID = uuid.uuid4().hex[:12]
+_response_cache: Dict[str, tuple] = {}  # endpoint -> (version, JSON body)
+
+def _state_changed(*endpoints: str):
+    """Mark the given cached endpoints stale, or all of them when none are named"""
+    for endpoint in endpoints or _CACHED_ENDPOINTS:
+        state_versions[endpoint] += 1
+
+def _cached_json_response(request: Request, endpoint: str, build) -> Response:
+    """Serve an endpoint's JSON body encoded once per version, answering 304 to a matching If-None-Match"""
+    version = state_versions[endpoint]
+    etag = f'"{_BOOT_ID}-{version}"'
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    cached = _response_cache.get(endpoint)
+    if cached is None or cached[0] != version:
+        cached = (version, orjson.dumps(build()))
+        _response_cache[endpoint] = cached
+    return Response(content=cached[1], media_type="application/json", headers={"ETag": etag})
+
 # Initialize sample data
 def initialize_sample_data():
-    global relief_centers, disaster_zones, road_network
+    global relief_centers, disaster_zones
     
     # Sample relief centers
     relief_centers = [
@@ -114,94 +250,106 @@ def initialize_sample_data():
         )
     ]
     
-    # Build road network
-    locations = [rc.location for rc in relief_centers] + [dz.location for dz in disaster_zones]
-    for i, loc1 in enumerate(locations):
-        for j, loc2 in enumerate(locations):
-            if i != j:
-                # Calculate distance using Haversine formula (simplified)
-                distance = calculate_distance(loc1.lat, loc1.lng, loc2.lat, loc2.lng)
-                travel_time = distance / 50  # Assume 50 km/h average speed
-                road_network.add_edge(loc1.id, loc2.id, weight=travel_time, distance=distance)
-
-def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Calculate distance between two points using Haversine formula"""
-    R = 6371  # Earth's radius in kilometers
-    
-    lat1_rad = np.radians(lat1)
-    lat2_rad = np.radians(lat2)
-    delta_lat = np.radians(lat2 - lat1)
-    delta_lng = np.radians(lng2 - lng1)
-    
-    a = np.sin(delta_lat/2)**2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lng/2)**2
-    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+    locations_by_id.clear()
+    _rad_cache.clear()
+    resources_by_center.clear()
+    resource_columns.clear()
+    for rc in relief_centers:
+        _index_relief_center(rc)
+    for dz in disaster_zones:
+        _index_disaster_zone(dz)
+    _build_center_quantities()
+
+def build_topology() -> Tuple[List[Location], np.ndarray]:
+    """All locations (relief centers first) and the Haversine distance matrix between them in km
     
-    return R * c
+    Computed once at startup and shared by the road network and the dynamic routing engine.
+    """
+    locations = [rc.location for rc in relief_centers] + [dz.location for dz in disaster_zones]
+    lats = np.array([loc.lat for loc in locations])
+    lngs = np.array([loc.lng for loc in locations])
+    return locations, haversine_distances(lats, lngs, lats, lngs)
+
+def initialize_road_network(locations: List[Location], distances: np.ndarray):
+    """Connect every pair of locations in the road network"""
+    travel_times = distances / 50  # Assume 50 km/h average speed
+    rows, cols = np.triu_indices(len(locations), k=1)
+    road_network.add_edges_from(
+        (locations[i].id, locations[j].id, {'weight': travel_times[i, j], 'distance': distances[i, j]})
+        for i, j in zip(rows.tolist(), cols.tolist())
+    )
+    _apsp_cache.update(adjacency=None, dirty=True)
 
-def initialize_dynamic_routing():
+def calculate_distance(from_id: str, to_id: str) -> float:
+    """Calculate distance between two indexed locations using Haversine formula"""
+    # Radians and latitude cosines are precomputed when a location is indexed
+    return haversine(*_rad_cache[from_id], *_rad_cache[to_id])
+
+def initialize_dynamic_routing(locations: List[Location], distances: np.ndarray):
     """Initialize the dynamic routing engine with sample data"""
     # Create locations for routing
-    locations = []
-    for rc in relief_centers:
-        locations.append({
-            'id': rc.location.id,
-            'lat': rc.location.lat,
-            'lng': rc.location.lng,
-            'type': rc.location.type,
-            'name': rc.location.name
-        })
-    
-    for dz in disaster_zones:
-        locations.append({
-            'id': dz.location.id,
-            'lat': dz.location.lat,
-            'lng': dz.location.lng,
-            'type': dz.location.type,
-            'name': dz.location.name
-        })
+    routing_locations = [
+        {
+            'id': loc.id,
+            'lat': loc.lat,
+            'lng': loc.lng,
+            'type': loc.type,
+            'name': loc.name
+        }
+        for loc in locations
+    ]
     
     # Create connections (all-to-all for demo)
     connections = []
     for i, loc1 in enumerate(locations):
         for j, loc2 in enumerate(locations):
             if i != j:
-                distance = calculate_distance(loc1['lat'], loc1['lng'], loc2['lat'], loc2['lng'])
+                distance = float(distances[i, j])
                 connections.append({
-                    'from': loc1['id'],
-                    'to': loc2['id'],
+                    'from': loc1.id,
+                    'to': loc2.id,
                     'distance': distance,
                     'time': distance / 50  # 50 km/h average
                 })
     
-    routing_engine.initialize_network(locations, connections)
+    routing_engine.initialize_network(routing_locations, connections)
     print("[Dynamic Routing] Routing engine initialized with sample network")
 
 @app.on_event("startup")
 async def startup_event():
     initialize_sample_data()
-    initialize_dynamic_routing()
+    locations, distances = build_topology()
+    initialize_road_network(locations, distances)
+    initialize_dynamic_routing(locations, distances)
+    _state_changed()
 
 # API Endpoints
 @app.get("/")
 async def root():
-    return {"message": "DisasterOps API is running", "timestamp": datetime.now()}
+    # Returned directly so orjson encodes the datetime itself
+    return ORJSONResponse({"message": "DisasterOps API is running", "timestamp": datetime.now()})
 
 @app.get("/relief-centers", response_model=List[ReliefCenter])
-async def get_relief_centers():
-    return relief_centers
+async def get_relief_centers(request: Request):
+    return _cached_json_response(request, "relief-centers", lambda: [rc.model_dump() for rc in relief_centers])
 
 @app.get("/disaster-zones", response_model=List[DisasterZone])
-async def get_disaster_zones():
-    return disaster_zones
+async def get_disaster_zones(request: Request):
+    return _cached_json_response(request, "disaster-zones", lambda: [dz.model_dump() for dz in disaster_zones])
 
 @app.post("/disaster-zones", response_model=DisasterZone)
 async def create_disaster_zone(zone: DisasterZone):
     disaster_zones.append(zone)
-    # Update road network
-    for rc in relief_centers:
-        distance = calculate_distance(zone.location.lat, zone.location.lng, rc.location.lat, rc.location.lng)
+    _index_disaster_zone(zone)
+    # Update road network, with distances to every relief center computed in one call
+    distances = haversine_distances([zone.location.lat], [zone.location.lng],
+                                    [rc.location.lat for rc in relief_centers],
+                                    [rc.location.lng for rc in relief_centers])[0]
+    for rc, distance in zip(relief_centers, distances.tolist()):
         travel_time = distance / 50
         road_network.add_edge(zone.location.id, rc.location.id, weight=travel_time, distance=distance)
+    _apsp_cache.update(adjacency=None, dirty=True)
+    _state_changed("disaster-zones")
     return zone
 
 @app.get("/optimize-allocation", response_model=List[AllocationResult])
@@ -212,83 +360,105 @@ async def optimize_resource_allocation():
     # Sort disaster zones by priority (highest first)
     sorted_zones = sorted(disaster_zones, key=lambda x: x.priority, reverse=True)
     
-    for zone in sorted_zones:
-        best_allocation = None
+    # Delivery times for every (center, zone) pair in one gather from the all-pairs cache;
+    # inf wherever either end is missing from the road network
+    apsp = _ensure_apsp()
+    center_rows = np.array([apsp["node_index"].get(rc.location.id, -1) for rc in relief_centers], dtype=np.int64)
+    zone_cols = np.array([apsp["node_index"].get(z.location.id, -1) for z in sorted_zones], dtype=np.int64)
+    delivery_times = apsp["dist"][np.ix_(center_rows, zone_cols)]
+    delivery_times[center_rows < 0, :] = np.inf
+    delivery_times[:, zone_cols < 0] = np.inf
+    
+    # Needs as a zone x resource matrix; needed_mask marks the resources each zone asks for,
+    # under the largest quantity given for that id
+    needed = np.zeros((len(sorted_zones), len(resource_columns)), dtype=np.int64)
+    needed_mask = np.zeros(needed.shape, dtype=bool)
+    satisfiable = np.ones(len(sorted_zones), dtype=bool)  # False when no center stocks one of the resources
+    for z, zone in enumerate(sorted_zones):
+        for needed_resource in zone.resources_needed:
+            column = resource_columns.get(needed_resource.id)
+            if column is None:
+                satisfiable[z] = False
+            elif not needed_mask[z, column] or needed_resource.quantity > needed[z, column]:
+                needed[z, column] = needed_resource.quantity
+                needed_mask[z, column] = True
+    
+    def eligibility(quantities: np.ndarray) -> np.ndarray:
+        """Whether centers with the given stock rows can fill each zone, as a center x zone matrix"""
+        covered = (quantities[:, None, :] >= needed[None, :, :]) | ~needed_mask[None, :, :]
+        return covered.all(axis=2) & satisfiable[None, :]
+    
+    eligible = eligibility(center_quantities)
+    
+    # Greedy in priority order; an allocation only changes the winning center's stock, so only its row is rechecked
+    for z, zone in enumerate(sorted_zones):
+        best_center = None
         min_delivery_time = float('inf')
         
-        for center in relief_centers:
-            # Check if center has required resources
-            can_fulfill = True
-            for needed_resource in zone.resources_needed:
-                center_resource = next((r for r in center.resources if r.id == needed_resource.id), None)
-                if not center_resource or center_resource.quantity < needed_resource.quantity:
-                    can_fulfill = False
-                    break
-            
-            if can_fulfill:
-                # Calculate shortest path
-                try:
-                    path = nx.shortest_path(road_network, center.location.id, zone.location.id, weight='weight')
-                    delivery_time = nx.shortest_path_length(road_network, center.location.id, zone.location.id, weight='weight')
-                    
-                    if delivery_time < min_delivery_time:
-                        min_delivery_time = delivery_time
-                        
-                        # Create route coordinates
-                        route_coords = []
-                        for node_id in path:
-                            location = next((loc for loc in [rc.location for rc in relief_centers] + [dz.location for dz in disaster_zones] if loc.id == node_id), None)
-                            if location:
-                                route_coords.append({"lat": location.lat, "lng": location.lng})
-                        
-                        best_allocation = AllocationResult(
-                            relief_center_id=center.location.id,
-                            disaster_zone_id=zone.location.id,
-                            resources_allocated=zone.resources_needed.copy(),
-                            route=route_coords,
-                            estimated_delivery_time=delivery_time
-                        )
-                except nx.NetworkXNoPath:
-                    continue
+        if relief_centers:
+            zone_times = np.where(eligible[:, z], delivery_times[:, z], np.inf)
+            best = int(np.argmin(zone_times))  # first minimum, so ties go to the earlier center
+            if np.isfinite(zone_times[best]):
+                min_delivery_time = float(zone_times[best])
+                best_center = relief_centers[best]
         
-        if best_allocation:
+        if best_center is not None:
+            _, path = _shortest_path(best_center.location.id, zone.location.id)
+            
+            # Create route coordinates
+            route_coords = []
+            for node_id in path:
+                location = locations_by_id.get(node_id)
+                if location:
+                    route_coords.append({"lat": location.lat, "lng": location.lng})
+            
+            best_allocation = AllocationResult(
+                relief_center_id=best_center.location.id,
+                disaster_zone_id=zone.location.id,
+                resources_allocated=zone.resources_needed,  # never mutated, so shared rather than copied
+                route=route_coords,
+                estimated_delivery_time=min_delivery_time
+            )
             results.append(best_allocation)
             
             # Update resource quantities (simulate allocation)
-            center = next(rc for rc in relief_centers if rc.location.id == best_allocation.relief_center_id)
-            for allocated_resource in best_allocation.resources_allocated:
-                center_resource = next(r for r in center.resources if r.id == allocated_resource.id)
+            center_resources = resources_by_center[best_allocation.relief_center_id]
+            for allocated_resource in zone.resources_needed:
+                center_resource = center_resources[allocated_resource.id]
                 center_resource.quantity -= allocated_resource.quantity
+                center_quantities[best, resource_columns[allocated_resource.id]] = center_resource.quantity
+            eligible[best] = eligibility(center_quantities[best:best + 1])[0]
+            _state_changed("relief-centers")
     
     return results
 
 @app.get("/shortest-path/{from_id}/{to_id}")
 async def get_shortest_path(from_id: str, to_id: str):
     """Get shortest path between two locations"""
-    try:
-        path = nx.shortest_path(road_network, from_id, to_id, weight='weight')
-        distance = nx.shortest_path_length(road_network, from_id, to_id, weight='weight')
-        
-        # Convert path to coordinates
-        route_coords = []
-        for node_id in path:
-            location = next((loc for loc in [rc.location for rc in relief_centers] + [dz.location for dz in disaster_zones] if loc.id == node_id), None)
-            if location:
-                route_coords.append({"lat": location.lat, "lng": location.lng, "id": location.id, "name": location.name})
-        
-        return {
-            "path": path,
-            "distance": distance,
-            "route_coordinates": route_coords
-        }
-    except nx.NetworkXNoPath:
+    shortest = _shortest_path(from_id, to_id)
+    if shortest is None:
         raise HTTPException(status_code=404, detail="No path found between locations")
+    distance, path = shortest
+    
+    # Convert path to coordinates
+    route_coords = []
+    for node_id in path:
+        location = locations_by_id.get(node_id)
+        if location:
+            route_coords.append({"lat": location.lat, "lng": location.lng, "id": location.id, "name": location.name})
+    
+    return {
+        "path": path,
+        "distance": distance,
+        "route_coordinates": route_coords
+    }
 
 @app.post("/simulate-road-closure")
 async def simulate_road_closure(from_id: str, to_id: str):
     """Simulate road closure and update network"""
     if road_network.has_edge(from_id, to_id):
         road_network.remove_edge(from_id, to_id)
+        _set_road_weight(from_id, to_id, np.inf)
         return {"message": f"Road between {from_id} and {to_id} has been closed"}
     else:
         raise HTTPException(status_code=404, detail="Road not found")
@@ -297,13 +467,14 @@ async def simulate_road_closure(from_id: str, to_id: str):
 async def restore_road(from_id: str, to_id: str):
     """Restore a closed road"""
     # Find locations
-    loc1 = next((loc for loc in [rc.location for rc in relief_centers] + [dz.location for dz in disaster_zones] if loc.id == from_id), None)
-    loc2 = next((loc for loc in [rc.location for rc in relief_centers] + [dz.location for dz in disaster_zones] if loc.id == to_id), None)
+    loc1 = locations_by_id.get(from_id)
+    loc2 = locations_by_id.get(to_id)
     
     if loc1 and loc2:
-        distance = calculate_distance(loc1.lat, loc1.lng, loc2.lat, loc2.lng)
+        distance = calculate_distance(from_id, to_id)
         travel_time = distance / 50
         road_network.add_edge(from_id, to_id, weight=travel_time, distance=distance)
+        _set_road_weight(from_id, to_id, travel_time)
         return {"message": f"Road between {from_id} and {to_id} has been restored"}
     else:
         raise HTTPException(status_code=404, detail="Locations not found")
@@ -312,6 +483,7 @@ async def restore_road(from_id: str, to_id: str):
 async def get_dynamic_route(origin: str, destination: str, priority: int = 3):
     """Get optimized dynamic route between two locations"""
     route = routing_engine.find_optimal_route(origin, destination, priority)
+    _state_changed("network-stats")  # the engine tracks active routes and caches paths
     
     if not route:
         raise HTTPException(status_code=404, detail="No route found")
@@ -361,6 +533,7 @@ async def update_road_condition(from_node: str, to_node: str, condition: str):
     try:
         road_condition = RoadCondition[condition.upper()]
         routing_engine.update_road_condition(from_node, to_node, road_condition)
+        _state_changed("network-stats")
         return {"message": f"Road condition updated: {from_node} -> {to_node} = {condition}"}
     except KeyError:
         raise HTTPException(status_code=400, detail=f"Invalid road condition: {condition}")
@@ -371,6 +544,7 @@ async def update_traffic(from_node: str, to_node: str, traffic: str):
     try:
         traffic_level = TrafficLevel[traffic.upper()]
         routing_engine.update_traffic_level(from_node, to_node, traffic_level)
+        _state_changed("network-stats")
         return {"message": f"Traffic updated: {from_node} -> {to_node} = {traffic}"}
     except KeyError:
         raise HTTPException(status_code=400, detail=f"Invalid traffic level: {traffic}")
@@ -388,18 +562,25 @@ async def simulate_conditions(condition_type: str):
     """Simulate changing conditions for demo"""
     if condition_type == "traffic":
         routing_engine.simulate_traffic_conditions()
+        _state_changed("network-stats")
         return {"message": "Traffic conditions simulated"}
     elif condition_type == "incidents":
         routing_engine.simulate_road_incidents()
+        _state_changed("network-stats")
         return {"message": "Road incidents simulated"}
     else:
         raise HTTPException(status_code=400, detail="Invalid condition type")
 
 @app.get("/network-stats")
-async def get_network_stats():
+async def get_network_stats(request: Request):
     """Get current network statistics"""
-    return routing_engine.get_network_statistics()
+    return _cached_json_response(request, "network-stats", routing_engine.get_network_statistics)
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvicorn[standard] brings uvloop (not on Windows) and the httptools parser.
+    # All state lives in this process, so the server must stay a single worker.
+    uvicorn.run(app, host="0.0.0.0", port=8000,
+                loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+                http="httptools" if importlib.util.find_spec("httptools") else "h11")
@@ -7,10 +7,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
 import networkx as nx
 import numpy as np
-import matplotlib.pyplot as plt
-from advanced_algorithms import GeneticAlgorithmOptimizer, SimulatedAnnealingOptimizer, MultiObjectiveOptimizer
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor
 
 # Mock data structures to match the backend models
 class MockLocation:
@@ -125,74 +124,57 @@ def create_sample_data():
     road_network = nx.Graph()
     all_locations = [rc.location for rc in relief_centers] + [dz.location for dz in disaster_zones]
     
-    for i, loc1 in enumerate(all_locations):
-        for j, loc2 in enumerate(all_locations):
-            if i != j:
-                # Calculate distance using simplified formula
-                distance = np.sqrt((loc1.lat - loc2.lat)**2 + (loc1.lng - loc2.lng)**2) * 111  # Rough km conversion
-                travel_time = distance / 50  # Assume 50 km/h average speed
-                road_network.add_edge(loc1.id, loc2.id, weight=travel_time, distance=distance)
+    # Calculate all distances at once using simplified formula
+    lat = np.array([loc.lat for loc in all_locations])
+    lng = np.array([loc.lng for loc in all_locations])
+    distances = np.sqrt((lat[:, None] - lat[None, :])**2 + (lng[:, None] - lng[None, :])**2) * 111  # Rough km conversion
+    travel_times = distances / 50  # Assume 50 km/h average speed
+    
+    # The network is undirected, so each pair is added once
+    road_network.add_edges_from(
+        (all_locations[i].id, all_locations[j].id, {'weight': travel_times[i, j], 'distance': distances[i, j]})
+        for i in range(len(all_locations)) for j in range(i + 1, len(all_locations))
+    )
     
     return relief_centers, disaster_zones, road_network
 
-def benchmark_algorithms():
-    """Benchmark different optimization algorithms"""
-    print("🚀 DisasterOps Algorithm Benchmarking")
-    print("=" * 50)
-    
-    # Create sample data
-    relief_centers, disaster_zones, road_network = create_sample_data()
-    
-    print(f"📊 Test Setup:")
-    print(f"   Relief Centers: {len(relief_centers)}")
-    print(f"   Disaster Zones: {len(disaster_zones)}")
-    print(f"   Road Network Edges: {road_network.number_of_edges()}")
-    print()
-    
-    results = {}
-    
-    # Test Genetic Algorithm
-    print("🧬 Testing Genetic Algorithm...")
+# Benchmark runners are top-level functions so worker processes can unpickle them.
+# Each imports only the optimizer it runs.
+def _run_ga(data):
+    from advanced_algorithms import GeneticAlgorithmOptimizer
+    relief_centers, disaster_zones, road_network = data
     ga_optimizer = GeneticAlgorithmOptimizer(population_size=30, generations=50, mutation_rate=0.1)
     start_time = time.time()
     ga_solution = ga_optimizer.optimize_allocation(relief_centers, disaster_zones, road_network)
     ga_time = time.time() - start_time
     
-    results['genetic_algorithm'] = {
+    return {
         'total_cost': ga_solution.total_cost,
         'coverage_score': ga_solution.coverage_score,
         'time_efficiency': ga_solution.time_efficiency,
         'execution_time': ga_time,
         'routes': len(ga_solution.routes)
     }
-    
-    print(f"   ✅ Completed in {ga_time:.2f}s")
-    print(f"   📈 Coverage Score: {ga_solution.coverage_score:.4f}")
-    print(f"   💰 Total Cost: {ga_solution.total_cost:.2f}")
-    print()
-    
-    # Test Simulated Annealing
-    print("🌡️  Testing Simulated Annealing...")
+
+def _run_sa(data):
+    from advanced_algorithms import SimulatedAnnealingOptimizer
+    relief_centers, disaster_zones, road_network = data
     sa_optimizer = SimulatedAnnealingOptimizer(initial_temp=1000, cooling_rate=0.95)
     start_time = time.time()
     sa_solution = sa_optimizer.optimize(relief_centers, disaster_zones, road_network)
     sa_time = time.time() - start_time
     
-    results['simulated_annealing'] = {
+    return {
         'total_cost': sa_solution.total_cost,
         'coverage_score': sa_solution.coverage_score,
         'time_efficiency': sa_solution.time_efficiency,
         'execution_time': sa_time,
         'routes': len(sa_solution.routes)
     }
-    
-    print(f"   ✅ Completed in {sa_time:.2f}s")
-    print(f"   📈 Coverage Score: {sa_solution.coverage_score:.4f}")
-    print(f"   💰 Total Cost: {sa_solution.total_cost:.2f}")
-    print()
-    
-    # Test Multi-Objective Optimization
-    print("🎯 Testing Multi-Objective Optimization...")
+
+def _run_mo(data):
+    from advanced_algorithms import MultiObjectiveOptimizer
+    relief_centers, disaster_zones, road_network = data
     mo_optimizer = MultiObjectiveOptimizer(population_size=30, generations=30)
     start_time = time.time()
     mo_solutions = mo_optimizer.optimize(relief_centers, disaster_zones, road_network)
@@ -201,7 +183,7 @@ def benchmark_algorithms():
     # Select best solution from Pareto front
     best_mo_solution = max(mo_solutions, key=lambda s: s.coverage_score - s.total_cost * 0.1)
     
-    results['multi_objective'] = {
+    return {
         'total_cost': best_mo_solution.total_cost,
         'coverage_score': best_mo_solution.coverage_score,
         'time_efficiency': best_mo_solution.time_efficiency,
@@ -209,11 +191,50 @@ def benchmark_algorithms():
         'routes': len(best_mo_solution.routes),
         'pareto_solutions': len(mo_solutions)
     }
+
+def benchmark_algorithms():
+    """Benchmark different optimization algorithms"""
+    print("🚀 DisasterOps Algorithm Benchmarking")
+    print("=" * 50)
+    
+    # Create sample data
+    data = create_sample_data()
+    relief_centers, disaster_zones, road_network = data
     
-    print(f"   ✅ Completed in {mo_time:.2f}s")
-    print(f"   📈 Best Coverage Score: {best_mo_solution.coverage_score:.4f}")
-    print(f"   💰 Best Total Cost: {best_mo_solution.total_cost:.2f}")
-    print(f"   🎯 Pareto Solutions Found: {len(mo_solutions)}")
+    print(f"📊 Test Setup:")
+    print(f"   Relief Centers: {len(relief_centers)}")
+    print(f"   Disaster Zones: {len(disaster_zones)}")
+    print(f"   Road Network Edges: {road_network.number_of_edges()}")
+    print()
+    
+    # The optimizers are independent and CPU-bound, so each runs in its own process
+    print("⚙️  Running Genetic Algorithm, Simulated Annealing and Multi-Objective Optimization in parallel...")
+    print()
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futures = {name: executor.submit(runner, data) for name, runner in
+                   [('genetic_algorithm', _run_ga), ('simulated_annealing', _run_sa), ('multi_objective', _run_mo)]}
+        results = {name: future.result() for name, future in futures.items()}
+    
+    # Test Genetic Algorithm
+    print("🧬 Genetic Algorithm")
+    print(f"   ✅ Completed in {results['genetic_algorithm']['execution_time']:.2f}s")
+    print(f"   📈 Coverage Score: {results['genetic_algorithm']['coverage_score']:.4f}")
+    print(f"   💰 Total Cost: {results['genetic_algorithm']['total_cost']:.2f}")
+    print()
+    
+    # Test Simulated Annealing
+    print("🌡️  Simulated Annealing")
+    print(f"   ✅ Completed in {results['simulated_annealing']['execution_time']:.2f}s")
+    print(f"   📈 Coverage Score: {results['simulated_annealing']['coverage_score']:.4f}")
+    print(f"   💰 Total Cost: {results['simulated_annealing']['total_cost']:.2f}")
+    print()
+    
+    # Test Multi-Objective Optimization
+    print("🎯 Multi-Objective Optimization")
+    print(f"   ✅ Completed in {results['multi_objective']['execution_time']:.2f}s")
+    print(f"   📈 Best Coverage Score: {results['multi_objective']['coverage_score']:.4f}")
+    print(f"   💰 Best Total Cost: {results['multi_objective']['total_cost']:.2f}")
+    print(f"   🎯 Pareto Solutions Found: {results['multi_objective']['pareto_solutions']}")
     print()
     
     # Summary comparison
@@ -254,6 +275,7 @@ def demonstrate_real_time_optimization():
     
     # Initial optimization
     print("📍 Initial Optimization...")
+    from advanced_algorithms import GeneticAlgorithmOptimizer
     ga_optimizer = GeneticAlgorithmOptimizer(population_size=20, generations=30)
     initial_solution = ga_optimizer.optimize_allocation(relief_centers, disaster_zones, road_network)
     